@@ -9,6 +9,14 @@ import random
 import platform
 import zipfile
 import json
+import re
+import copy
+import shutil
+import atexit
+import tempfile
+import threading
+from collections import OrderedDict
+from datetime import datetime
 from typing import Dict, Optional, Any, List, Tuple
 from pathlib import Path
 from selenium.webdriver.common.by import By
@@ -19,7 +27,6 @@ from selenium.common.exceptions import (
     NoSuchElementException,
     WebDriverException
 )
-import undetected_chromedriver as uc
 from fake_useragent import UserAgent
 
 from ..utils.proxy_rotator import ProxyRotator
@@ -27,6 +34,172 @@ from ..utils.cookie_manager import CookieManager
 
 logger = logging.getLogger(__name__)
 
+# undetected_chromedriver is imported on first use (see _get_uc) so that
+# importing this module for helpers or type references stays cheap.
+uc = None
+
+
+def _get_uc():
+    """Import and return the undetected_chromedriver module."""
+    global uc
+    if uc is None:
+        import undetected_chromedriver
+        uc = undetected_chromedriver
+    return uc
+
+
+# Browser profile directories not yet removed by BrowserEngine.close()
+_live_profile_dirs = set()
+
+
+@atexit.register
+def _remove_live_profile_dirs() -> None:
+    """Remove profile directories left behind by sessions that never closed."""
+    for profile_dir in list(_live_profile_dirs):
+        shutil.rmtree(profile_dir, ignore_errors=True)
+    _live_profile_dirs.clear()
+
+
+# CDP events that signal the CAPTCHA frame may have been solved or removed
+CAPTCHA_PAGE_EVENTS = ("Page.frameNavigated", "Page.frameDetached")
+
+# Safety-net poll interval (seconds) while waiting on CDP events
+CAPTCHA_FALLBACK_POLL = 5
+
+# Karma display format: digits with optional separators and k/m/b suffix
+_KARMA_RE = re.compile(r"\s*(\d[\d,]*(?:\.\d+)?)\s*([kmb]?)", re.IGNORECASE)
+_KARMA_MULTIPLIERS = {"": 1, "k": 1_000, "m": 1_000_000, "b": 1_000_000_000}
+
+# Profile page URLs
+PROFILE_URL = "https://www.reddit.com/user/{username}"
+COMMUNITIES_URL = "https://www.reddit.com/user/{username}/communities"
+
+# Profile page selectors
+KARMA_SELECTOR = "._3XFx6CfPlg-4Usgxm0gK8R"
+CAKE_DAY_SELECTOR = "._2VF2J19pUIMSLJFky-7PEI"
+TROPHY_SELECTOR = "._2Gq3CSlw6ertQlLjXyMFaM"
+COMMUNITY_SELECTOR = "._3q9sJ7I9Ep1QkC8dOK4wxD"
+
+# Upper bounds (seconds) when waiting for profile content to render
+PROFILE_RENDER_TIMEOUT = 4
+COMMUNITIES_RENDER_TIMEOUT = 3
+
+# True once the selector matches, or the fallback text is on the page
+RENDER_CHECK_JS = (
+    "return !!document.querySelector(arguments[0]) || "
+    "(!!arguments[1] && !!document.body && document.body.innerText.includes(arguments[1]));"
+)
+
+# Text Reddit renders on the profile page of a non-existent account
+USER_NOT_FOUND_TEXT = "nobody on Reddit goes by that name"
+
+# Common desktop resolutions weighted by approximate StatCounter share.
+# Random-looking dimensions are themselves a bot signal, so one realistic
+# resolution is picked per process and reused for every session.
+SCREEN_RESOLUTIONS = (
+    ((1920, 1080), 23),
+    ((1536, 864), 9),
+    ((1440, 900), 5),
+)
+SCREEN_RESOLUTION = random.choices(
+    [resolution for resolution, _ in SCREEN_RESOLUTIONS],
+    weights=[weight for _, weight in SCREEN_RESOLUTIONS]
+)[0]
+
+# Fingerprint patches, grouped by the minimum stealth level that applies them.
+# Each snippet is guarded so one failing patch doesn't abort the others.
+_FINGERPRINT_SNIPPETS = {
+    1: [
+        # Basic webdriver masking
+        """
+        Object.defineProperty(navigator, 'webdriver', {
+            get: () => false
+        });
+        """,
+        # Plugin spoofing
+        """
+        Object.defineProperty(navigator, 'plugins', {
+            get: () => [1, 2, 3, 4, 5]
+        });
+        """,
+        # Language spoofing
+        """
+        Object.defineProperty(navigator, 'languages', {
+            get: () => ['en-US', 'en']
+        });
+        """
+    ],
+    2: [
+        # Screen resolution spoofing (fixed per process, see SCREEN_RESOLUTION)
+        """
+        Object.defineProperty(screen, 'width', {
+            get: () => %d
+        });
+        Object.defineProperty(screen, 'height', {
+            get: () => %d
+        });
+        """ % SCREEN_RESOLUTION,
+        # Timezone spoofing
+        """
+        Object.defineProperty(Intl.DateTimeFormat.prototype, 'resolvedOptions', {
+            get: function() {
+                return () => {
+                    const options = Reflect.apply(
+                        Intl.DateTimeFormat.prototype.resolvedOptions,
+                        this,
+                        []
+                    );
+                    options.timeZone = 'America/New_York';
+                    return options;
+                };
+            }
+        });
+        """
+    ],
+    3: [
+        # Advanced API spoofing
+        """
+        const originalQuery = window.navigator.permissions.query;
+        window.navigator.permissions.query = (parameters) => (
+            parameters.name === 'notifications' ?
+            Promise.resolve({ state: 'denied' }) :
+            originalQuery(parameters)
+        );
+        """,
+        # AudioContext fingerprint spoofing
+        """
+        Object.defineProperty(AudioContext.prototype, 'sampleRate', {
+            get: () => 44100
+        });
+        """,
+        # Geolocation spoofing
+        """
+        navigator.geolocation.getCurrentPosition = function(success, error) {
+            success({
+                coords: {
+                    latitude: 40.7128 + (Math.random() * 0.01),
+                    longitude: -74.0060 + (Math.random() * 0.01),
+                    accuracy: 10
+                }
+            });
+        };
+        """
+    ]
+}
+
+
+def _build_anti_detect_js(stealth_level: int) -> str:
+    """Combine fingerprint snippets up to ``stealth_level`` into one script."""
+    return "\n".join(
+        "try {%s} catch (e) {}" % snippet
+        for level in range(1, stealth_level + 1)
+        for snippet in _FINGERPRINT_SNIPPETS[level]
+    )
+
+
+# Pre-built anti-detection payloads keyed by stealth level (1-3)
+ANTI_DETECT_JS = {level: _build_anti_detect_js(level) for level in (1, 2, 3)}
+
 class BrowserEngine:
     """
     Manages stealthy Chrome browser sessions with:
@@ -50,7 +223,10 @@ class BrowserEngine:
                     "element": 10,
                     "captcha": 45
                 },
-                "chrome_version": 119  # Optional
+                "chrome_version": 119,  # Optional
+                "cache_ttl": 300,  # Seconds to reuse extracted profiles
+                "cache_size": 128,  # Max cached profiles
+                "max_tabs": 5  # Concurrent tabs for batch extraction
             }
             proxy_rotator: ProxyRotator instance
         """
@@ -60,6 +236,10 @@ class BrowserEngine:
         self.profile_dir = None
         self.cookie_manager = CookieManager()
 
+        # CDP page-event signalling (see _subscribe_page_events)
+        self._page_changed = threading.Event()
+        self._cdp_listening = False
+
         # Timeout configuration
         self.timeouts = {
             "page_load": 30,
@@ -73,6 +253,11 @@ class BrowserEngine:
         self.headless = config.get("headless", False)
         self.chrome_version = config.get("chrome_version")
 
+        # Per-username profile cache: {username: (timestamp, info)}
+        self.cache_ttl = config.get("cache_ttl", 300)
+        self.cache_size = config.get("cache_size", 128)
+        self._profile_cache: OrderedDict = OrderedDict()
+
         # Initialize random user agent if not specified
         self.user_agent = config.get("user_agent") or UserAgent().chrome
 
@@ -97,13 +282,14 @@ class BrowserEngine:
             options = self._configure_options()
 
             # Initialize undetected Chrome
-            self.driver = uc.Chrome(
+            self.driver = _get_uc().Chrome(
                 options=options,
                 user_data_dir=str(self.profile_dir),
                 headless=self.headless,
                 version_main=self.chrome_version,
                 patcher_force_close=True,
-                suppress_welcome=True
+                suppress_welcome=True,
+                enable_cdp_events=True
             )
 
             # Configure timeouts
@@ -122,16 +308,21 @@ class BrowserEngine:
             raise
 
     def _create_profile_dir(self) -> Path:
-        """Create isolated browser profile directory."""
-        import uuid
-        profile_dir = Path(f"tmp/profiles/{uuid.uuid4().hex}")
-        profile_dir.mkdir(parents=True, exist_ok=True)
+        """
+        Create isolated browser profile directory.
+
+        Uses the system temp dir (often tmpfs) with an OS-guaranteed unique
+        name; the directory is also removed at interpreter exit in case
+        close() never runs.
+        """
+        profile_dir = Path(tempfile.mkdtemp(prefix="reddit_persona_"))
+        _live_profile_dirs.add(profile_dir)
         logger.debug("Created profile directory: %s", profile_dir)
         return profile_dir
 
-    def _configure_options(self) -> uc.ChromeOptions:
+    def _configure_options(self) -> "uc.ChromeOptions":
         """Configure Chrome options with anti-detection settings."""
-        options = uc.ChromeOptions()
+        options = _get_uc().ChromeOptions()
 
         # Standard options
         options.add_argument("--disable-blink-features=AutomationControlled")
@@ -159,7 +350,7 @@ class BrowserEngine:
         # Headless-specific options
         if self.headless:
             options.add_argument("--headless=new")
-            options.add_argument("--window-size=1920,1080")
+            options.add_argument("--window-size=%d,%d" % SCREEN_RESOLUTION)
 
         # Stealth level specific options
         if self.stealth_level >= 2:
@@ -173,97 +364,39 @@ class BrowserEngine:
         return options
 
     def _apply_fingerprint_spoofing(self) -> None:
-        """Modify browser fingerprint to avoid detection."""
-        scripts = [
-            # Basic webdriver masking
-            """
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => false
-            });
-            """,
-
-            # Plugin spoofing
-            """
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
-            """,
-
-            # Language spoofing
-            """
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en']
-            });
-            """
-        ]
+        """
+        Modify browser fingerprint to avoid detection.
 
-        # Additional stealth measures for higher levels
-        if self.stealth_level >= 2:
-            scripts.extend([
-                # Screen resolution spoofing
-                """
-                Object.defineProperty(screen, 'width', {
-                    get: () => 1920 + Math.floor(Math.random() * 100)
-                });
-                Object.defineProperty(screen, 'height', {
-                    get: () => 1080 + Math.floor(Math.random() * 100)
-                });
-                """,
-
-                # Timezone spoofing
-                """
-                Object.defineProperty(Intl.DateTimeFormat.prototype, 'resolvedOptions', {
-                    get: function() {
-                        return () => {
-                            const options = Reflect.apply(
-                                Intl.DateTimeFormat.prototype.resolvedOptions,
-                                this,
-                                []
-                            );
-                            options.timeZone = 'America/New_York';
-                            return options;
-                        };
-                    }
-                });
-                """
-            ])
+        The patches are registered on the initial tab via
+        ``Page.addScriptToEvaluateOnNewDocument`` so they run before any page
+        script on every subsequent navigation, instead of after load. Tabs
+        opened later get them from _apply_tab_stealth.
+        """
+        try:
+            self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument",
+                {"source": ANTI_DETECT_JS[min(max(self.stealth_level, 1), 3)]}
+            )
+        except Exception as e:
+            logger.debug("Fingerprint script registration failed: %s", str(e))
 
-        if self.stealth_level >= 3:
-            scripts.extend([
-                # Advanced API spoofing
-                """
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                    Promise.resolve({ state: 'denied' }) :
-                    originalQuery(parameters)
-                );
-                """,
-                # AudioContext fingerprint spoofing
-                """
-                Object.defineProperty(AudioContext.prototype, 'sampleRate', {
-                    get: () => 44100
-                });
-                """,
-                # Geolocation spoofing
-                """
-                navigator.geolocation.getCurrentPosition = function(success, error) {
-                    success({
-                        coords: {
-                            latitude: 40.7128 + (Math.random() * 0.01),
-                            longitude: -74.0060 + (Math.random() * 0.01),
-                            accuracy: 10
-                        }
-                    });
-                };
-                """
-            ])
+    def _apply_tab_stealth(self) -> None:
+        """
+        Register the anti-detection patches on the currently focused tab.
 
-        for script in scripts:
-            try:
-                self.driver.execute_script(script)
-            except Exception as e:
-                logger.debug("Fingerprint script failed: %s", str(e))
+        CDP scripts and undetected_chromedriver's headless user agent fix
+        only apply to the target they were sent to, so a tab created with
+        ``Target.createTarget`` starts unpatched. Unlike the initial tab,
+        failures raise: a tab must never load a page without its patches.
+        """
+        self.driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument",
+            {"source": ANTI_DETECT_JS[min(max(self.stealth_level, 1), 3)]}
+        )
+        self.driver.execute_cdp_cmd(
+            "Network.setUserAgentOverride",
+            {"userAgent": self.user_agent}
+        )
 
     def _apply_stealth_techniques(self) -> None:
         """Apply additional stealth techniques based on configuration."""
@@ -311,12 +444,13 @@ class BrowserEngine:
                 logger.error("Error closing browser: %s", str(e))
             finally:
                 self.driver = None
+                self._cdp_listening = False
 
         # Clean up profile directory
-        if hasattr(self, 'profile_dir') and self.profile_dir.exists():
+        if self.profile_dir and self.profile_dir.exists():
             try:
-                import shutil
                 shutil.rmtree(self.profile_dir)
+                _live_profile_dirs.discard(self.profile_dir)
                 logger.debug("Removed profile directory: %s", self.profile_dir)
             except Exception as e:
                 logger.error("Failed to remove profile: %s", str(e))
@@ -386,10 +520,10 @@ class BrowserEngine:
         """Check if we're logged in as the specified user."""
         try:
             self.driver.get("https://www.reddit.com")
-            WebDriverWait(self.driver, 5).until(
+            dropdown = WebDriverWait(self.driver, 5).until(
                 EC.presence_of_element_located((By.ID, "USER_DROPDOWN_ID"))
             )
-            return username.lower() in self.driver.page_source.lower()
+            return username.lower() in dropdown.text.lower()
         except:
             return False
 
@@ -411,31 +545,180 @@ class BrowserEngine:
         return False
 
     def _handle_captcha(self) -> bool:
-        """Handle CAPTCHA challenge with timeout."""
-        start_time = time.time()
+        """
+        Handle CAPTCHA challenge with timeout.
+
+        Rather than polling the DOM every second, this subscribes to CDP page
+        events and only re-checks for the challenge when a frame navigates or
+        detaches (which is what happens when the challenge iframe is solved or
+        removed). A slow fallback poll covers drivers without CDP events.
+        """
         timeout = self.timeouts["captcha"]
+        deadline = time.time() + timeout
+        on_login_page = "login" in self.driver.current_url
 
         logger.info("Waiting for CAPTCHA resolution (timeout: %ds)", timeout)
 
-        while time.time() - start_time < timeout:
+        listening = self._subscribe_page_events()
+        poll_interval = CAPTCHA_FALLBACK_POLL if listening else 1
+
+        while time.time() < deadline:
+            # Clear before checking so an event fired mid-check isn't lost
+            self._page_changed.clear()
+            if on_login_page and "login" not in self.driver.current_url:
+                return True
             if not self._check_for_captcha():
                 return True
-            time.sleep(1)
+
+            self._page_changed.wait(min(poll_interval, max(0, deadline - time.time())))
 
         logger.warning("CAPTCHA resolution timed out")
         return False
 
+    def _subscribe_page_events(self) -> bool:
+        """
+        Register CDP listeners that set ``_page_changed`` on frame navigation.
+
+        Listeners are registered once per driver session.
+
+        Returns:
+            bool: True if the driver delivers CDP events
+        """
+        if self._cdp_listening:
+            return True
+        if not hasattr(self.driver, "add_cdp_listener"):
+            return False
+
+        try:
+            self.driver.execute_cdp_cmd("Page.enable", {})
+            for event in CAPTCHA_PAGE_EVENTS:
+                self.driver.add_cdp_listener(event, lambda _msg: self._page_changed.set())
+            self._cdp_listening = True
+        except Exception as e:
+            logger.debug("CDP event subscription failed: %s", str(e))
+
+        return self._cdp_listening
+
     def extract_account_info(self, username: str) -> Dict[str, Any]:
         """
         Extract detailed account information from Reddit profile.
 
+        Results are memoized per username for ``cache_ttl`` seconds, so
+        repeated lookups within a session skip the scrape.
+
         Returns:
             Dictionary containing account metrics
         """
+        cached = self._get_cached_profile(username)
+        if cached is not None:
+            logger.debug("Using cached account info for %s", username)
+            return cached
+
         if not self.driver:
             self.initialize()
 
-        info = {
+        info = self._new_account_info(username)
+
+        try:
+            # Navigate to profile
+            self.driver.get(PROFILE_URL.format(username=username))
+            self._wait_for_render(KARMA_SELECTOR, PROFILE_RENDER_TIMEOUT, USER_NOT_FOUND_TEXT)
+
+            self._parse_profile_page(info)
+            if not info["exists"]:
+                return info
+
+            # Extract active communities
+            try:
+                self.driver.get(COMMUNITIES_URL.format(username=username))
+                self._wait_for_render(COMMUNITY_SELECTOR, COMMUNITIES_RENDER_TIMEOUT)
+                self._parse_communities_page(info)
+            except:
+                pass
+
+        except Exception as e:
+            logger.error("Account info extraction failed: %s", str(e))
+            return self._failed_account_info(username, e)
+
+        self._cache_profile(username, info)
+        return info
+
+    def extract_account_info_batch(self, usernames: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Extract account information for several users in one browser.
+
+        Users are processed in chunks of ``max_tabs``. For each chunk, every
+        profile and communities page is opened in its own tab via CDP
+        ``Target.createTarget`` so the page loads overlap, then the tabs are
+        read one at a time over the (single-threaded) WebDriver session.
+
+        Returns:
+            Dictionary mapping each username to its account metrics; users
+            whose pages failed to load map to a record with an ``"error"`` key
+        """
+        results = {}
+        pending = []
+        for username in dict.fromkeys(usernames):
+            cached = self._get_cached_profile(username)
+            if cached is not None:
+                results[username] = cached
+            else:
+                pending.append(username)
+
+        if not pending:
+            return results
+
+        if not self.driver:
+            self.initialize()
+
+        max_tabs = max(1, self.config.get("max_tabs", 5))
+        original_window = self.driver.current_window_handle
+
+        try:
+            for i in range(0, len(pending), max_tabs):
+                tabs = {}
+                for username in pending[i:i + max_tabs]:
+                    try:
+                        tabs[username] = self._open_account_tabs(username)
+                    except Exception as e:
+                        logger.error("Failed to open tabs for %s: %s", username, str(e))
+                        results[username] = self._failed_account_info(username, e)
+
+                for username, (profile_tab, communities_tab) in tabs.items():
+                    info = self._new_account_info(username)
+                    try:
+                        self._switch_to_tab(profile_tab)
+                        self._wait_for_render(
+                            KARMA_SELECTOR, PROFILE_RENDER_TIMEOUT, USER_NOT_FOUND_TEXT)
+                        self._parse_profile_page(info)
+                    except Exception as e:
+                        logger.error("Account info extraction failed for %s: %s", username, str(e))
+                        results[username] = self._failed_account_info(username, e)
+                        self._close_tab(profile_tab)
+                        self._close_tab(communities_tab)
+                        continue
+
+                    self._close_tab(profile_tab)
+                    if info["exists"]:
+                        # Communities are optional, as in extract_account_info
+                        try:
+                            self._switch_to_tab(communities_tab)
+                            self._wait_for_render(COMMUNITY_SELECTOR, COMMUNITIES_RENDER_TIMEOUT)
+                            self._parse_communities_page(info)
+                        except Exception as e:
+                            logger.debug("Communities extraction failed for %s: %s", username, str(e))
+                        self._cache_profile(username, info)
+                    self._close_tab(communities_tab)
+
+                    results[username] = info
+        finally:
+            self.driver.switch_to.window(original_window)
+
+        return results
+
+    def _new_account_info(self, username: str) -> Dict[str, Any]:
+        """Build the default account info record for a username."""
+        return {
             "username": username,
             "exists": True,
             "karma": 0,
@@ -448,84 +731,179 @@ class BrowserEngine:
             "warnings": []
         }
 
+    def _failed_account_info(self, username: str, error: Exception) -> Dict[str, Any]:
+        """Build the record for a username whose profile could not be read."""
+        return {
+            "username": username,
+            "exists": False,
+            "error": f"Profile extraction failed: {error}"
+        }
+
+    def _parse_profile_page(self, info: Dict[str, Any]) -> None:
+        """Fill ``info`` from the profile page loaded in the current tab."""
+        # Check if user exists
+        if self._page_text_contains(USER_NOT_FOUND_TEXT):
+            info["exists"] = False
+            return
+
+        # Check for blank body (possible shadowban)
         try:
-            # Navigate to profile
-            self.driver.get(f"https://www.reddit.com/user/{username}")
-            self._random_delay(2, 4)
+            body_text = self.driver.find_element(By.TAG_NAME, "body").text.strip()
+            if not body_text:
+                info["shadowbanned"] = True
+                info["warnings"] = ["User profile appears empty - possible shadowban"]
+        except Exception:
+            pass
 
-            # Check if user exists
-            if "nobody on Reddit goes by that name" in self.driver.page_source:
-                info["exists"] = False
-                return info
+        # Extract karma points
+        try:
+            karma_elements = self.driver.find_elements(
+                By.CSS_SELECTOR, KARMA_SELECTOR)
+            if karma_elements:
+                info["karma"] = self._parse_karma(karma_elements[0].text)
+        except:
+            pass
 
-            # Check for blank body (possible shadowban)
-            try:
-                body_text = self.driver.find_element(By.TAG_NAME, "body").text.strip()
-                if not body_text:
-                    info["shadowbanned"] = True
-                    info["warnings"] = ["User profile appears empty - possible shadowban"]
-            except Exception:
-                pass
+        # Extract account age
+        try:
+            cake_day = self.driver.find_element(
+                By.CSS_SELECTOR, CAKE_DAY_SELECTOR).text
+            info["age_days"] = self._parse_cake_day(cake_day)
+        except:
+            pass
 
-            # Extract karma points
-            try:
-                karma_elements = self.driver.find_elements(
-                    By.CSS_SELECTOR, "._3XFx6CfPlg-4Usgxm0gK8R")
-                if karma_elements:
-                    info["karma"] = self._parse_karma(karma_elements[0].text)
-            except:
-                pass
+        # Extract trophies and badges
+        try:
+            trophy_elements = self.driver.find_elements(
+                By.CSS_SELECTOR, TROPHY_SELECTOR)
+            trophies = [text for text in (t.text for t in trophy_elements) if text]
+            info["trophies"] = trophies
+            for trophy in trophies:
+                if "Verified" in trophy:
+                    info["verified"] = True
+                if "Moderator" in trophy:
+                    info["moderator"] = True
+        except:
+            pass
 
-            # Extract account age
-            try:
-                cake_day = self.driver.find_element(
-                    By.CSS_SELECTOR, "._2VF2J19pUIMSLJFky-7PEI").text
-                info["age_days"] = self._parse_cake_day(cake_day)
-            except:
-                pass
+    def _parse_communities_page(self, info: Dict[str, Any]) -> None:
+        """Fill ``info["communities"]`` from the communities page in the current tab."""
+        community_elements = self.driver.find_elements(
+            By.CSS_SELECTOR, COMMUNITY_SELECTOR)
+        info["communities"] = [c.text for c in community_elements[:10]]
 
-            # Extract trophies and badges
-            try:
-                trophy_elements = self.driver.find_elements(
-                    By.CSS_SELECTOR, "._2Gq3CSlw6ertQlLjXyMFaM")
-                info["trophies"] = [t.text for t in trophy_elements if t.text]
-                info["verified"] = any("Verified" in t for t in info["trophies"])
-                info["moderator"] = any("Moderator" in t for t in info["trophies"])
-            except:
-                pass
+    def _open_account_tabs(self, username: str) -> Tuple[str, str]:
+        """Open a user's profile and communities pages, returning both target ids."""
+        profile_tab = self._open_tab(PROFILE_URL.format(username=username))
+        try:
+            communities_tab = self._open_tab(COMMUNITIES_URL.format(username=username))
+        except Exception:
+            self._close_tab(profile_tab)
+            raise
+        return profile_tab, communities_tab
 
-            # Extract active communities
-            try:
-                self.driver.get(f"https://www.reddit.com/user/{username}/communities")
-                self._random_delay(2, 3)
+    def _open_tab(self, url: str) -> str:
+        """
+        Open ``url`` in a new tab and return its target id.
 
-                community_elements = self.driver.find_elements(
-                    By.CSS_SELECTOR, "._3q9sJ7I9Ep1QkC8dOK4wxD")
-                info["communities"] = [c.text for c in community_elements[:10]]
-            except:
-                pass
+        The tab is created blank and patched (see _apply_tab_stealth) before
+        navigating, so the page's own scripts never see an unpatched browser.
+        ``Page.navigate`` returns once the navigation starts, so loads still
+        overlap across tabs.
+        """
+        target_id = self.driver.execute_cdp_cmd("Target.createTarget", {"url": "about:blank"})["targetId"]
+        try:
+            # Chromedriver uses the CDP target id as the window handle
+            self.driver.switch_to.window(target_id)
+            self._apply_tab_stealth()
+            self.driver.execute_cdp_cmd("Page.navigate", {"url": url})
+        except Exception:
+            self._close_tab(target_id)
+            raise
+        return target_id
+
+    def _switch_to_tab(self, target_id: str) -> None:
+        """Focus a tab opened by _open_tab and wait for its document to load."""
+        # Chromedriver uses the CDP target id as the window handle
+        self.driver.switch_to.window(target_id)
+        WebDriverWait(self.driver, self.timeouts["page_load"]).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
 
-        except Exception as e:
-            logger.error("Account info extraction failed: %s", str(e))
+    def _close_tab(self, target_id: str) -> None:
+        """Close a tab opened by _open_tab."""
+        try:
+            self.driver.execute_cdp_cmd("Target.closeTarget", {"targetId": target_id})
+        except WebDriverException as e:
+            logger.debug("Failed to close tab %s: %s", target_id, str(e))
+
+    def _get_cached_profile(self, username: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a fresh cached profile, evicting it if expired."""
+        key = username.lower()
+        entry = self._profile_cache.get(key)
+        if entry is None:
+            return None
+
+        cached_at, info = entry
+        if time.time() - cached_at >= self.cache_ttl:
+            del self._profile_cache[key]
+            return None
+
+        self._profile_cache.move_to_end(key)
+        return copy.deepcopy(info)
+
+    def _cache_profile(self, username: str, info: Dict[str, Any]) -> None:
+        """Store a copy of extracted account info, evicting the oldest entries."""
+        if self.cache_ttl <= 0 or self.cache_size <= 0:
+            return
 
-        return info
+        key = username.lower()
+        self._profile_cache[key] = (time.time(), copy.deepcopy(info))
+        self._profile_cache.move_to_end(key)
+        while len(self._profile_cache) > self.cache_size:
+            self._profile_cache.popitem(last=False)
 
-    def _parse_karma(self, karma_text: str) -> int:
-        """Parse karma string into integer."""
-        multipliers = {
-            'k': 1000,
-            'm': 1000000
-        }
+    def _wait_for_render(self, selector: str, timeout: float,
+                         fallback_text: Optional[str] = None) -> bool:
+        """
+        Wait until ``selector`` (or ``fallback_text``) appears on the page.
 
-        karma_text = karma_text.lower().replace(',', '')
-        if karma_text[-1] in multipliers:
-            return int(float(karma_text[:-1]) * multipliers[karma_text[-1]])
-        return int(float(karma_text))
+        Replaces fixed post-navigation sleeps: returns as soon as the page has
+        rendered the content we are about to read, and never waits longer
+        than the old fixed delay.
+
+        Returns:
+            bool: True if the marker appeared before the timeout
+        """
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(
+                lambda d: d.execute_script(RENDER_CHECK_JS, selector, fallback_text)
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def _page_text_contains(self, text: str) -> bool:
+        """Check the rendered page text in-browser, without pulling page_source."""
+        try:
+            return bool(self.driver.execute_script(
+                "return !!document.body && document.body.innerText.includes(arguments[0]);",
+                text
+            ))
+        except WebDriverException as e:
+            logger.debug("Page text check failed: %s", str(e))
+            return False
+
+    def _parse_karma(self, karma_text: str) -> int:
+        """Parse karma string (e.g. "1,234", "10.5k", "1.2M") into integer."""
+        match = _KARMA_RE.match(karma_text)
+        if not match:
+            return 0
+        number = float(match.group(1).replace(",", ""))
+        return int(round(number * _KARMA_MULTIPLIERS[match.group(2).lower()]))
 
     def _parse_cake_day(self, cake_day_text: str) -> int:
         """Calculate account age in days from cake day."""
-        from datetime import datetime
-
         try:
             formats = ["%b %d, %Y", "%B %d, %Y", "%d %b %Y", "%d %B %Y"]
             for fmt in formats:
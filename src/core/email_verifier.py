@@ -6,34 +6,211 @@ import email
 import logging
 import re
 import time
-import hashlib
+import socket
+import ssl
+import itertools
+import random
+import base64
+import binascii
+import quopri
+import asyncio
+import atexit
+import threading
 import getpass
-from typing import Dict, Optional, List, Tuple, Any, Union
-from datetime import datetime, timedelta
-from email.utils import parsedate_to_datetime
+import hmac
+import hashlib
+import secrets
+from typing import Dict, Optional, List, Tuple, Any, Union, Iterable, Iterator
+from datetime import date, datetime, timedelta, timezone
+from email import policy
+from email.parser import BytesHeaderParser
 from functools import wraps, lru_cache
-from contextlib import contextmanager
-import signal
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
-class TimeoutError(Exception):
-    pass
+# Max message ids per FETCH command; larger sets can exceed server limits
+FETCH_BATCH_SIZE = 100
+
+# UID item in a UID FETCH response line; the leading number is the sequence number
+FETCH_UID_RE = re.compile(rb'\bUID (\d+)')
+UIDNEXT_RE = re.compile(rb'\bUIDNEXT (\d+)')
+
+# Verification link, either as an HTML anchor or a bare URL (one pass)
+VERIFICATION_LINK_RE = re.compile(
+    r'<a href="(?P<href>https?://[^"]+verification[^"]+)'
+    r'|(?P<url>https?://[^\s"]*reddit\.com/verification/[^\s>"]+)',
+    re.IGNORECASE
+)
+
+# Servers may drop IDLE after 30 minutes (RFC 2177), so re-issue before then
+IDLE_MAX_SECONDS = 29 * 60
+
+# Parsed verification emails kept per verifier; polling re-sees the same UIDs
+PARSE_CACHE_SIZE = 1024
+
+# Upper bound on concurrent IMAP sessions in verify_many(); providers cap
+# simultaneous connections per IP (e.g. Dovecot's mail_max_userip_connections)
+MAX_PARALLEL_SESSIONS = 5
+
+# Result errors for a mailbox that was checked and simply had no verification
+# yet; every other error means the IMAP session itself failed
+NO_VERIFICATION_FOUND = "No existing verification found"
+VERIFICATION_TIMEOUT = "Verification timeout reached"
 
-def timeout_handler(signum, frame):
-    raise TimeoutError("Operation timed out")
+# Fallback fetch: header fields needed for processing (plus MIME structure)
+# and the whole body text
+FETCH_MESSAGE_PARTS = (
+    '(INTERNALDATE BODY.PEEK[HEADER.FIELDS (DATE SUBJECT MESSAGE-ID FROM '
+    'MIME-VERSION CONTENT-TYPE CONTENT-TRANSFER-ENCODING)] BODY.PEEK[TEXT])'
+)
 
-@contextmanager
-def timeout(seconds):
-    signal.signal(signal.SIGALRM, timeout_handler)
-    signal.alarm(seconds)
+# First round trip of a structured fetch: arrival time, MIME layout and the
+# headers we use
+FETCH_STRUCTURE_PARTS = (
+    '(INTERNALDATE BODYSTRUCTURE BODY.PEEK[HEADER.FIELDS (DATE SUBJECT MESSAGE-ID FROM)])'
+)
+
+# Header-only blocks (subject filter, structured fetch) skip body parsing
+_HEADER_PARSER = BytesHeaderParser(policy=policy.default)
+
+# Tokens of a BODYSTRUCTURE s-expression: parens, quoted strings, atoms
+BODYSTRUCTURE_TOKEN_RE = re.compile(rb'\(|\)|"((?:[^"\\]|\\.)*)"|([^\s()"]+)')
+
+# Pooled connections idle longer than this are dropped rather than reused;
+# Outlook and iCloud disconnect idle sessions after about 30 minutes
+POOL_IDLE_EXPIRY = 25 * 60
+
+def _logout_quietly(conn: imaplib.IMAP4_SSL) -> None:
     try:
-        yield
-    finally:
-        signal.alarm(0)
+        conn.logout()
+    except Exception:
+        pass
+
+class _ConnectionPool:
+    """
+    Logged-in IMAP connections shared across EmailVerifier instances.
+
+    Connections are keyed by (server, port, user, credential digest), so a
+    session is only handed to a verifier holding the password it was logged
+    in with, and removed while checked out, so two verifiers never share one
+    (imaplib objects are not thread-safe). Up to ``max_per_key`` idle
+    connections are kept per key.
+    """
 
-@dataclass
+    def __init__(self, max_per_key: int = MAX_PARALLEL_SESSIONS,
+                 idle_expiry: float = POOL_IDLE_EXPIRY):
+        self.max_per_key = max_per_key
+        self.idle_expiry = idle_expiry
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple[str, int, str, bytes], List[Tuple[imaplib.IMAP4_SSL, float]]] = {}
+
+    def checkout(self, key: Tuple[str, int, str, bytes]) -> Optional[imaplib.IMAP4_SSL]:
+        """Take the most recently used live connection for ``key``, if any."""
+        while True:
+            with self._lock:
+                entries = self._idle.get(key)
+                if not entries:
+                    return None
+                conn, last_used = entries.pop()
+                if not entries:
+                    del self._idle[key]
+
+            if time.monotonic() - last_used > self.idle_expiry:
+                _logout_quietly(conn)
+                continue
+            try:
+                conn.noop()
+                return conn
+            except (imaplib.IMAP4.error, OSError):
+                # Server dropped the idle connection
+                _logout_quietly(conn)
+
+    def release(self, key: Tuple[str, int, str, bytes], conn: imaplib.IMAP4_SSL) -> None:
+        """Return a connection, logging out the oldest if the key is full."""
+        surplus = None
+        with self._lock:
+            entries = self._idle.setdefault(key, [])
+            entries.append((conn, time.monotonic()))
+            if len(entries) > self.max_per_key:
+                surplus, _ = entries.pop(0)
+        if surplus is not None:
+            _logout_quietly(surplus)
+
+    def close_all(self) -> None:
+        """Log out of every pooled connection."""
+        with self._lock:
+            entries = [entry for idle in self._idle.values() for entry in idle]
+            self._idle.clear()
+        for conn, _ in entries:
+            _logout_quietly(conn)
+
+_pool = _ConnectionPool()
+atexit.register(_pool.close_all)
+
+# Per-process HMAC key for pool keys, so the password never sits in the pool
+# and digests can't be checked against guesses outside this process
+_POOL_KEY_SECRET = secrets.token_bytes(32)
+
+def _credential_digest(password: str) -> bytes:
+    """Keyed digest identifying a password within this process."""
+    return hmac.new(_POOL_KEY_SECRET, password.encode('utf-8'), hashlib.sha256).digest()
+
+# Backoff jitter; SystemRandom so forked workers don't share a seed
+_jitter = random.SystemRandom()
+
+def retry_imap(max_retries=3):
+    """Decorator for IMAP operation retries."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            for attempt in range(max_retries):
+                try:
+                    if not self.is_connected:
+                        self.connect()
+                    return func(self, *args, **kwargs)
+                except (imaplib.IMAP4.abort, ConnectionError) as e:
+                    if attempt == max_retries - 1:
+                        raise
+                    self._safe_disconnect()
+                    # Jittered so a pool of verifiers doesn't reconnect in lockstep
+                    time.sleep(min(4, 0.25 * (2 ** attempt) * _jitter.uniform(0.5, 1.5)))
+                except Exception as e:
+                    logger.error(f"Operation failed: {str(e)}")
+                    raise
+        return wrapper
+    return decorator
+
+@lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    """
+    TLS context shared by every IMAP connection.
+
+    imaplib otherwise builds a fresh context, reloading the system CA
+    bundle, for each connect.
+    """
+    return ssl.create_default_context()
+
+_IMAP_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+@lru_cache(maxsize=8)
+def _imap_date(day: date) -> str:
+    """
+    Format a SEARCH date (dd-Mon-yyyy).
+
+    IMAP month names are fixed English, unlike strftime's locale-dependent %b;
+    results are memoized since polling searches reuse the same few days.
+    """
+    return f"{day.day:02d}-{_IMAP_MONTHS[day.month - 1]}-{day.year}"
+
+def _imap_quote(value: str) -> str:
+    """Quote a string for use in an IMAP SEARCH criterion."""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+@dataclass(slots=True, frozen=True)
 class VerificationResult:
     verified: bool
     email: str
@@ -52,12 +229,15 @@ class EmailVerifier:
     - Credential security
     """
     
-    USERNAME_PATTERNS = [
-        r'reddit\.com/u/([\w-]+)',        # URL pattern
-        r'username:\s*([\w-]+)',          # Labeled pattern
-        r'u/([\w-]+)\s+is your username', # Common template
-        r'for u/([\w-]+)\s+to verify'     # Alternate template
-    ]
+    # Username templates fused into one alternation so the body is scanned
+    # once; the earliest match in the email wins
+    USERNAME_RE = re.compile(
+        r'reddit\.com/u/(?P<url>[\w-]+)'           # URL pattern
+        r'|username:\s*(?P<label>[\w-]+)'          # Labeled pattern
+        r'|u/(?P<common>[\w-]+)\s+is your username' # Common template
+        r'|for u/(?P<alt>[\w-]+)\s+to verify',      # Alternate template
+        re.IGNORECASE | re.ASCII
+    )
     
     def __init__(self, config: Dict[str, Any]):
         """
@@ -84,11 +264,25 @@ class EmailVerifier:
         # Secure credential handling
         self._username = config.get("email_user")
         self._password = config.get("email_pass") or getpass.getpass("Email password: ")
-        self._password_hash = hashlib.sha256(self._password.encode()).hexdigest()
         
         self.imap = None
         self.is_connected = False
         self._connection_lock = False
+        self._parse_cache: OrderedDict = OrderedDict()
+        self._selected_folder: Optional[str] = None
+        self._pool_key = (self.imap_server, self.imap_port, self._username,
+                          _credential_digest(self._password))
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle settings and cached parses but not the live IMAP session."""
+        state = self.__dict__.copy()
+        state.update(imap=None, is_connected=False, _connection_lock=False, _selected_folder=None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled verifier, re-keying it for this process's pool."""
+        self.__dict__.update(state)
+        self._pool_key = self._pool_key[:3] + (_credential_digest(self._password),)
 
     def __enter__(self):
         self.connect()
@@ -108,6 +302,23 @@ class EmailVerifier:
             
         self._connection_lock = True
         
+        pooled = _pool.checkout(self._pool_key)
+        if pooled is not None:
+            try:
+                self.imap = pooled
+                pooled.sock.settimeout(self.connection_timeout)
+                # Pooled connections are released with INBOX still selected
+                self._selected_folder = 'INBOX' if pooled.state == 'SELECTED' else None
+                self._ensure_selected('INBOX')
+                self.is_connected = True
+                self._connection_lock = False
+                logger.info("Reusing pooled IMAP connection")
+                return True
+            except (imaplib.IMAP4.error, OSError):
+                self.imap = None
+                self._selected_folder = None
+                _logout_quietly(pooled)
+        
         for attempt in range(1, self.max_retries + 1):
             try:
                 logger.info(f"Connection attempt {attempt}/{self.max_retries}")
@@ -115,11 +326,19 @@ class EmailVerifier:
                 self.imap = imaplib.IMAP4_SSL(
                     self.imap_server,
                     self.imap_port,
+                    ssl_context=_ssl_context(),
                     timeout=self.connection_timeout
                 )
                 
+                # IMAP is many small command/response exchanges; Nagle plus
+                # delayed ACK would stall each one. Keepalive lets long IDLE
+                # sessions survive NAT timeouts.
+                self.imap.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self.imap.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                
                 self.imap.login(self._username, self._password)
-                self.imap.select('INBOX')
+                self._selected_folder = None
+                self._ensure_selected('INBOX')
                 self.is_connected = True
                 logger.info("IMAP connection established")
                 return True
@@ -128,7 +347,7 @@ class EmailVerifier:
                 logger.error(f"IMAP error (attempt {attempt}): {str(e)}")
                 if attempt == self.max_retries:
                     raise
-                time.sleep(2 ** attempt)  # Exponential backoff
+                time.sleep(min(8, _jitter.uniform(0.5, 2 ** attempt)))  # Jittered exponential backoff
                 
             except Exception as e:
                 logger.error(f"Unexpected connection error: {str(e)}")
@@ -152,9 +371,35 @@ class EmailVerifier:
             self.imap = None
             self.is_connected = False
             self._connection_lock = False
+            self._selected_folder = None
+
+    def _ensure_selected(self, folder: str) -> None:
+        """SELECT ``folder`` unless it is already the selected mailbox."""
+        if folder == self._selected_folder:
+            return
+        self._selected_folder = None
+        result, data = self.imap.select(folder)
+        if result != 'OK':
+            raise imaplib.IMAP4.error(f"SELECT {folder} failed: {data}")
+        self._selected_folder = folder
 
     def disconnect(self) -> None:
-        """Thread-safe disconnection."""
+        """
+        Release the connection.
+
+        A healthy connection is returned to the shared pool with INBOX still
+        selected, so the next verifier for the same account skips TLS, LOGIN
+        and SELECT. Anything else is logged out.
+        """
+        if self.imap and self.is_connected and self._selected_folder == 'INBOX':
+            _pool.release(self._pool_key, self.imap)
+            self.imap = None
+            self.is_connected = False
+            self._connection_lock = False
+            self._selected_folder = None
+            logger.info("Returned IMAP connection to pool")
+            return
+                
         self._safe_disconnect()
         logger.info("Disconnected from IMAP server")
 
@@ -172,53 +417,232 @@ class EmailVerifier:
         Returns:
             VerificationResult dataclass
         """
-        result = VerificationResult(
-            verified=False,
-            email=email_address,
-            reddit_username=username
-        )
+        def failure(error: str) -> VerificationResult:
+            return VerificationResult(
+                verified=False,
+                email=email_address,
+                reddit_username=username,
+                error=error
+            )
         
+        # One deadline for the whole call; blocking socket reads are bounded
+        # separately by connection_timeout
+        deadline = time.monotonic() + self.verification_timeout
         try:
-            with timeout(self.verification_timeout):
-                if not self.connect():
-                    result.error = "Connection failed"
-                    return result
-                
-                # Check existing verifications
-                existing = self._search_verification_emails(username, days=30)
-                if existing:
-                    verification_data = self._process_verification_email(existing[0])
-                    if verification_data and verification_data.username.lower() == username.lower():
+            if not self.connect():
+                return failure("Connection failed")
+            
+            # Messages from here on get UIDs >= uid_next; request it before the
+            # existing-mail check so nothing slips between the two. The reply
+            # is collected after the SEARCH, so both share one round trip.
+            status_request = self._request_uid_next() if wait_for_verification else None
+            
+            # Check existing verifications
+            existing = self._search_verification_emails(username, days=30)
+            uid_next = self._uid_next(status_request) if status_request else None
+            verification_data = self._match_verification(existing, username)
+            if verification_data:
+                return self._create_success_result(verification_data, email_address, username)
+            
+            if not wait_for_verification:
+                return failure(NO_VERIFICATION_FOUND)
+            
+            # Wait for new verification: IMAP IDLE when supported, else polling
+            use_idle = self._supports_idle()
+            logger.info(f"Waiting for new verification via {'IDLE' if use_idle else 'polling'} "
+                        f"(timeout: {self.verification_timeout}s)")
+            # SINCE is day-granular, so the fallback window is fixed up front
+            poll_since = _imap_date((datetime.now() - timedelta(minutes=5)).date())
+            poll_interval = min(10, self.verification_timeout // 10)
+            new_mail = True
+            
+            while time.monotonic() < deadline:
+                if new_mail:
+                    if uid_next is not None:
+                        new_emails = self._search_verification_emails(username, min_uid=uid_next)
+                        newest = next(new_emails, None)
+                        if newest is not None:
+                            # Everything below this is examined before the next poll
+                            uid_next = int(newest) + 1
+                            new_emails = itertools.chain([newest], new_emails)
+                    else:
+                        new_emails = self._search_verification_emails(username, since=poll_since)
+                    verification_data = self._match_verification(new_emails, username)
+                    if verification_data:
                         return self._create_success_result(verification_data, email_address, username)
                 
-                if not wait_for_verification:
-                    result.error = "No existing verification found"
-                    return result
-                
-                # Poll for new verification
-                logger.info(f"Polling for new verification (timeout: {self.verification_timeout}s)")
-                start_time = time.time()
-                poll_interval = min(10, self.verification_timeout // 10)
-                
-                while time.time() - start_time < self.verification_timeout:
-                    new_emails = self._search_verification_emails(username, minutes=5)
-                    if new_emails:
-                        verification_data = self._process_verification_email(new_emails[0])
-                        if verification_data and verification_data.username.lower() == username.lower():
-                            return self._create_success_result(verification_data, email_address, username)
-                    
-                    time.sleep(poll_interval)
-                
-                result.error = "Verification timeout reached"
-                return result
-                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if use_idle:
+                    # Re-arm before the server's 30-minute IDLE cutoff
+                    new_mail = self._idle_wait(min(IDLE_MAX_SECONDS, remaining))
+                else:
+                    time.sleep(min(poll_interval, remaining))
+            
+            return failure(VERIFICATION_TIMEOUT)
+            
         except TimeoutError:
-            result.error = "Operation timed out"
-            return result
+            # socket.timeout from a blocked IMAP read; the stream is now out of
+            # step with the server, so the session must not go back to the pool
+            self._safe_disconnect()
+            return failure("Operation timed out")
         except Exception as e:
             logger.error(f"Verification error: {str(e)}", exc_info=True)
-            result.error = str(e)
-            return result
+            # Possibly mid-IDLE or with stale untagged responses; drop it
+            self._safe_disconnect()
+            return failure(str(e))
+
+    async def verify_reddit_account_async(self, username: str, email_address: str,
+                                          wait_for_verification: bool = True) -> VerificationResult:
+        """
+        Awaitable verify_reddit_account for use inside an event loop.
+
+        The blocking IMAP session runs in a worker thread, so IDLE waits and
+        FETCH round-trips don't stall the loop.
+        """
+        return await asyncio.to_thread(
+            self.verify_reddit_account, username, email_address, wait_for_verification
+        )
+
+    @classmethod
+    def verify_many(cls, accounts: List[Tuple[Dict[str, Any], str]],
+                    wait_for_verification: bool = False) -> Dict[str, VerificationResult]:
+        """
+        Verify several accounts concurrently, one IMAP session per mailbox.
+
+        Args:
+            accounts: (config, reddit_username) pairs; each config is passed
+                to EmailVerifier as-is and must include ``email_user``
+            wait_for_verification: Whether each worker polls for new emails
+
+        Returns:
+            Dict mapping reddit username to its VerificationResult
+        """
+        if not accounts:
+            return {}
+
+        results = {}
+        workers = min(MAX_PARALLEL_SESSIONS, len(accounts))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(cls._verify_one, config, username, wait_for_verification): username
+                for config, username in accounts
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        return results
+
+    @classmethod
+    async def verify_many_async(cls, accounts: List[Tuple[Dict[str, Any], str]],
+                                wait_for_verification: bool = False) -> Dict[str, VerificationResult]:
+        """
+        Awaitable verify_many: gathers one worker-thread session per account.
+
+        At most MAX_PARALLEL_SESSIONS sessions are open at once, so wall time
+        is bounded by the slowest batch rather than the sum of all accounts.
+        """
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_SESSIONS)
+
+        async def verify(config: Dict[str, Any], username: str) -> VerificationResult:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    cls._verify_one, config, username, wait_for_verification
+                )
+
+        results = await asyncio.gather(*(verify(config, username) for config, username in accounts))
+        return {username: result for (_, username), result in zip(accounts, results)}
+
+    @classmethod
+    def _verify_one(cls, config: Dict[str, Any], username: str,
+                    wait_for_verification: bool) -> VerificationResult:
+        """Run one verification in its own session; failures become results."""
+        try:
+            with cls(config) as verifier:
+                return verifier.verify_reddit_account(
+                    username, config.get("email_user"), wait_for_verification
+                )
+        except Exception as e:
+            logger.error(f"Verification for {username} failed: {str(e)}")
+            return VerificationResult(
+                verified=False,
+                email=config.get("email_user"),
+                reddit_username=username,
+                error=str(e)
+            )
+
+    def _supports_idle(self) -> bool:
+        """Whether the server advertises the IDLE extension (RFC 2177)."""
+        return 'IDLE' in getattr(self.imap, 'capabilities', ())
+
+    def _idle_wait(self, timeout: float) -> bool:
+        """
+        Block in IMAP IDLE until the server pushes new mail or ``timeout`` expires.
+
+        imaplib has no IDLE support before Python 3.14, so the command is sent
+        by hand and its lines are read through imaplib's buffered reader.
+
+        Returns:
+            bool: True if an EXISTS/RECENT notification arrived
+        """
+        # A notification imaplib already collected during the last SEARCH or
+        # FETCH won't be repeated once idling
+        untagged = self.imap.untagged_responses
+        if untagged.pop('EXISTS', None) or untagged.pop('RECENT', None):
+            return True
+
+        tag = self.imap._new_tag()
+        self.imap.send(tag + b' IDLE\r\n')
+
+        line = self._read_idle_line(time.monotonic() + self.connection_timeout)
+        if line is None or not line.startswith(b'+'):
+            raise imaplib.IMAP4.error(f"IDLE not accepted: {line!r}")
+
+        new_mail = False
+        deadline = time.monotonic() + timeout
+        try:
+            while not new_mail:
+                line = self._read_idle_line(deadline)
+                if line is None:
+                    break
+                if line.startswith(b'*') and (b'EXISTS' in line or b'RECENT' in line):
+                    new_mail = True
+        finally:
+            self.imap.send(b'DONE\r\n')
+            done_deadline = time.monotonic() + self.connection_timeout
+            while True:
+                line = self._read_idle_line(done_deadline)
+                if line is None:
+                    raise imaplib.IMAP4.abort("No response to IDLE DONE")
+                if line.startswith(tag):
+                    break
+
+        return new_mail
+
+    def _read_idle_line(self, deadline: float) -> Optional[bytes]:
+        """Read one line through imaplib, or None if ``deadline`` passes first."""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        self.imap.sock.settimeout(remaining)
+        try:
+            return self.imap.readline().rstrip(b'\r\n')
+        except TimeoutError:
+            # A socket file refuses reads once one has timed out; open a new
+            # one as imaplib.open() does. Servers send untagged lines whole,
+            # so no partial line is lost with the old buffer.
+            self.imap.file = self.imap.sock.makefile('rb')
+            return None
+        finally:
+            self.imap.sock.settimeout(self.connection_timeout)
+
+    def _match_verification(self, email_ids: Iterable[bytes], username: str) -> Optional[Dict[str, Any]]:
+        """Parsed data of the first email whose extracted username matches."""
+        for email_id in email_ids:
+            verification_data = self._process_verification_email(email_id)
+            if verification_data and verification_data["username"].lower() == username.lower():
+                return verification_data
+        return None
 
     def _create_success_result(self, verification_data: Dict, email: str, username: str) -> VerificationResult:
         """Helper to create successful verification result."""
@@ -231,16 +655,35 @@ class EmailVerifier:
         )
 
     @retry_imap()
-    @lru_cache(maxsize=100)
     def _process_verification_email(self, email_id: bytes) -> Optional[Dict[str, Any]]:
         """
-        Cached email processing with enhanced extraction.
+        Parse a verification email, once per message.
+
+        Delivered messages never change, so the parsed result (including
+        "not a verification email") is cached by UID and repeat searches in
+        the wait loop skip the FETCH entirely. Failed fetches are not cached.
         """
+        if email_id in self._parse_cache:
+            self._parse_cache.move_to_end(email_id)
+            return self._parse_cache[email_id]
+
         email_data = self._fetch_email(email_id)
         if not email_data:
             return None
-            
-        body = self._get_email_body(email_data["message"])
+
+        parsed = self._parse_verification_email(email_data)
+        self._parse_cache[email_id] = parsed
+        if len(self._parse_cache) > PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        return parsed
+
+    def _parse_verification_email(self, email_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Extract username, link and metadata from a fetched message."""
+        msg = email_data["message"]
+        # Every verification email links to reddit.com, so unrelated mail is
+        # rejected on the raw bytes before any decoding
+        body = self._get_email_body(email_data["payload"], email_data["charset"],
+                                    marker=b"reddit.com")
         username = self._extract_username(body)
         if not username:
             return None
@@ -248,128 +691,370 @@ class EmailVerifier:
         return {
             "username": username,
             "verification_link": self._extract_verification_link(body),
-            "timestamp": self._get_email_timestamp(email_data["message"]),
-            "message_id": email_data["message"].get("Message-ID", "").strip("<>"),
-            "subject": email_data["message"].get("Subject")
+            "timestamp": email_data.get("received") or self._get_email_timestamp(msg),
+            "message_id": msg.get("Message-ID", "").strip("<>"),
+            "subject": str(msg["Subject"] or "")
         }
 
     def _extract_username(self, body: str) -> Optional[str]:
         """Multi-pattern username extraction."""
-        body_lower = body.lower()
-        for pattern in self.USERNAME_PATTERNS:
-            match = re.search(pattern, body_lower)
-            if match:
-                return match.group(1)
+        match = self.USERNAME_RE.search(body)
+        if match:
+            return match.group(match.lastgroup).lower()
         return None
 
     def _extract_verification_link(self, body: str) -> Optional[str]:
         """Robust link extraction."""
-        patterns = [
-            r'(https?://[^\s]*reddit\.com/verification/[^\s>]+)',
-            r'<a href="(https?://[^"]+verification[^"]+)'
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, body, re.IGNORECASE)
-            if match:
-                return match.group(1)
+        match = VERIFICATION_LINK_RE.search(body)
+        if match:
+            return match.group("href") or match.group("url")
         return None
 
     def _get_email_timestamp(self, msg) -> Optional[str]:
-        """Safe timestamp parsing."""
-        date_str = msg.get("Date")
-        if date_str:
-            try:
-                return parsedate_to_datetime(date_str).isoformat()
-            except (ValueError, TypeError):
-                logger.warning(f"Failed to parse email date: {date_str}")
-        return None
+        """
+        ISO timestamp of the Date header, as already parsed by policy.default.
+
+        Fallback for servers that don't return INTERNALDATE.
+        """
+        date = msg["Date"]
+        if date is None:
+            return None
+        if date.datetime is None:
+            logger.warning(f"Failed to parse email date: {date}")
+            return None
+        return date.datetime.isoformat()
 
     @retry_imap()
     def _search_verification_emails(self, username: Optional[str] = None, 
-                                  days: int = 0, minutes: int = 0) -> List[bytes]:
+                                  days: int = 0, minutes: int = 0,
+                                  min_uid: Optional[int] = None,
+                                  since: Optional[str] = None) -> Iterator[bytes]:
         """
         Enhanced email search with combined criteria.
+
+        UIDs are yielded newest first. The SEARCH runs immediately; when the
+        username has to be filtered client-side, subjects are fetched one
+        batch at a time as the caller iterates, so stopping at the first
+        match skips the remaining FETCHes.
+
+        With ``min_uid`` only messages at or above that UID are considered,
+        so polling costs scale with new mail rather than mailbox size.
+        ``since`` is a preformatted IMAP date and overrides days/minutes.
+
+        The decorator only covers the SEARCH; the lazy subject FETCHes run
+        after this returns and are retried per batch by _fetch_subjects.
         """
         criteria = ['(FROM "reddit.com")', '(SUBJECT "verification")']
         
-        if days > 0 or minutes > 0:
+        if min_uid is not None:
+            criteria.append(f'(UID {min_uid}:*)')
+            
+        if since:
+            criteria.append(f'(SINCE "{since}")')
+        elif days > 0 or minutes > 0:
             since_date = (datetime.now() - timedelta(days=days, minutes=minutes))
-            criteria.append(f'(SINCE "{since_date.strftime("%d-%b-%Y")}")')
+            criteria.append(f'(SINCE "{_imap_date(since_date.date())}")')
             
-        result, data = self.imap.search(None, ' '.join(criteria))
-        if result != 'OK':
-            return []
+        if username:
+            # Let the server filter on the username first; templates name the
+            # account in the subject or only in the body
+            quoted = _imap_quote(username)
+            email_ids = self._search(criteria + [f'(OR SUBJECT {quoted} BODY {quoted})'])
+            if email_ids is not None:
+                return reversed(self._drop_below(email_ids, min_uid))
+            logger.warning("Server-side username search failed, filtering client-side")
             
-        email_ids = data[0].split()
+        email_ids = self._drop_below(self._search(criteria) or [], min_uid)
         if not username or not email_ids:
-            return email_ids
+            return reversed(email_ids)
             
         # Filter by username if provided
-        return [eid for eid in email_ids if self._email_matches_username(eid, username)]
+        return self._filter_by_subject(email_ids, username)
+
+    @staticmethod
+    def _drop_below(email_ids: List[bytes], min_uid: Optional[int]) -> List[bytes]:
+        """
+        Drop UIDs under ``min_uid``.
 
-    def _email_matches_username(self, email_id: bytes, username: str) -> bool:
-        """Efficient username matching without full processing."""
+        ``UID n:*`` always matches the newest message, even when its UID is
+        below n, so the range alone does not exclude already-seen mail.
+        """
+        if min_uid is None:
+            return email_ids
+        return [uid for uid in email_ids if int(uid) >= min_uid]
+
+    def _request_uid_next(self) -> Tuple[imaplib.IMAP4_SSL, bytes]:
+        """
+        Send STATUS INBOX (UIDNEXT) without waiting for the reply.
+
+        imaplib files tagged replies that arrive while another command is
+        being read, so the next command can go out on the same round trip.
+        Collect the result with _uid_next() on the returned (connection, tag).
+        """
+        return self.imap, self.imap._command('STATUS', 'INBOX', '(UIDNEXT)')
+
+    def _uid_next(self, request: Tuple[imaplib.IMAP4_SSL, bytes]) -> Optional[int]:
+        """
+        UIDNEXT from a pipelined STATUS, or None if the server won't report it.
+
+        If a retry reconnected in between, the reply went down with the old
+        socket, so STATUS is sent again on the current connection.
+        """
+        conn, tag = request
+        if conn is not self.imap:
+            logger.debug("Reconnected since STATUS was sent, re-issuing it")
+            conn, tag = self._request_uid_next()
         try:
-            result, data = self.imap.fetch(email_id, '(BODY.PEEK[HEADER.FIELDS (SUBJECT)])')
-            if result == 'OK' and data:
-                subject = data[0][1].decode('utf-8', errors='ignore')
-                return username.lower() in subject.lower()
-        except Exception:
-            logger.warning(f"Failed to check username match for email {email_id}")
-        return False
+            result, data = self.imap._command_complete('STATUS', tag)
+            result, data = self.imap._untagged_response(result, data, 'STATUS')
+        except imaplib.IMAP4.abort:
+            raise
+        except imaplib.IMAP4.error as e:
+            logger.warning(f"STATUS UIDNEXT failed: {str(e)}")
+            return None
+        if result != 'OK' or not data:
+            return None
+        match = UIDNEXT_RE.search(data[0] or b"")
+        return int(match.group(1)) if match else None
+
+    def _search(self, criteria: List[str]) -> Optional[List[bytes]]:
+        """Run SEARCH with the given criteria; None if the server rejects it."""
+        try:
+            result, data = self.imap.uid('SEARCH', None, ' '.join(criteria))
+        except imaplib.IMAP4.abort:
+            raise
+        except imaplib.IMAP4.error as e:
+            logger.warning(f"IMAP search failed: {str(e)}")
+            return None
+        if result != 'OK':
+            return None
+        return data[0].split()
+
+    def _filter_by_subject(self, email_ids: List[bytes], username: str) -> Iterator[bytes]:
+        """Yield ids (newest first) whose subject mentions the username, one FETCH batch at a time."""
+        username = username.lower()
+        newest_first = email_ids[::-1]
+        for i in range(0, len(newest_first), FETCH_BATCH_SIZE):
+            chunk = newest_first[i:i + FETCH_BATCH_SIZE]
+            try:
+                subjects = self._fetch_subjects(chunk)
+            except imaplib.IMAP4.abort:
+                raise
+            except imaplib.IMAP4.error as e:
+                logger.warning(f"Failed to check username match for emails: {str(e)}")
+                return
+
+            for eid in chunk:
+                if username in self._decode_subject(subjects.get(eid, b"")).lower():
+                    yield eid
+
+    @retry_imap()
+    def _fetch_subjects(self, email_ids: List[bytes]) -> Dict[bytes, bytes]:
+        """
+        Subject headers for ``email_ids``.
+
+        Called while _filter_by_subject is being iterated, after the
+        decorated search has returned, so aborted FETCHes are retried here.
+        UIDs survive the reconnect, so the batch is simply re-sent.
+        """
+        return self._fetch_batch(email_ids, '(BODY.PEEK[HEADER.FIELDS (SUBJECT)])')
+
+    @staticmethod
+    def _decode_subject(header_bytes: bytes) -> str:
+        """Subject from raw header bytes, with RFC 2047 encoded-words decoded."""
+        msg = _HEADER_PARSER.parsebytes(header_bytes)
+        return str(msg["Subject"] or "")
+
+    def _fetch_batch(self, email_ids: List[bytes], message_parts: str) -> Dict[bytes, bytes]:
+        """
+        FETCH ``message_parts`` for many messages with one command per chunk.
+
+        Returns:
+            Dict mapping each UID to its returned literal
+        """
+        results = {}
+        for i in range(0, len(email_ids), FETCH_BATCH_SIZE):
+            chunk = email_ids[i:i + FETCH_BATCH_SIZE]
+            result, data = self.imap.uid('FETCH', b','.join(chunk), message_parts)
+            if result != 'OK':
+                continue
+
+            # Responses interleave (b'<seq> (UID <uid> <item> {size}', literal)
+            # tuples with closing b')' entries
+            for item in data:
+                if isinstance(item, tuple) and len(item) == 2:
+                    match = FETCH_UID_RE.search(item[0])
+                    if match:
+                        results[match.group(1)] = item[1]
+        return results
 
     @retry_imap()
     def _fetch_email(self, email_id: bytes) -> Optional[Dict[str, Any]]:
-        """Optimized email fetching with header preference."""
+        """
+        Fetch the headers we use plus the preferred text part.
+
+        BODYSTRUCTURE locates the text/plain (else text/html) section so only
+        that part is downloaded, not images or attachments. Messages whose
+        structure can't be read fall back to fetching the whole body text.
+        PEEK leaves messages marked unread either way.
+
+        Returns:
+            Dict with the header ``message``, the transfer-decoded text
+            ``payload`` and its ``charset``, or None if the fetch failed
+        """
         try:
-            result, data = self.imap.fetch(email_id, '(RFC822)')
-            if result == 'OK' and data:
-                return {
-                    "id": email_id,
-                    "message": email.message_from_bytes(data[0][1])
-                }
+            return self._fetch_text_section(email_id) or self._fetch_full_text(email_id)
+        except imaplib.IMAP4.abort:
+            raise
         except Exception as e:
             logger.error(f"Email fetch failed: {str(e)}")
         return None
 
-    def _get_email_body(self, msg) -> str:
-        """Complete multi-part email body extraction."""
-        body = ""
-        if msg.is_multipart():
-            for part in msg.walk():
-                ctype = part.get_content_type()
-                if ctype in ["text/plain", "text/html"]:
-                    try:
-                        body += part.get_payload(decode=True).decode('utf-8', errors='ignore')
-                    except:
-                        body += str(part.get_payload(decode=True))
-                    if ctype == "text/plain":  # Prefer plain text
-                        break
-        else:
-            payload = msg.get_payload(decode=True)
-            body = payload.decode('utf-8', errors='ignore')
-        return body.strip()
+    def _fetch_text_section(self, email_id: bytes) -> Optional[Dict[str, Any]]:
+        """Structured fetch; None if the BODYSTRUCTURE response isn't usable."""
+        result, data = self.imap.uid('FETCH', email_id, FETCH_STRUCTURE_PARTS)
+        if result != 'OK' or not data:
+            return None
+
+        # Expect a single literal (the headers); BODYSTRUCTURE sits in the
+        # surrounding response text
+        literals = [item for item in data if isinstance(item, tuple)]
+        if len(literals) != 1:
+            return None
+        response = b" ".join(item[0] if isinstance(item, tuple) else item for item in data)
+        structure = self._parse_bodystructure(response)
+        if not structure:
+            return None
+        part = self._select_text_part(structure)
+        if part is None:
+            return None
+        section, charset, encoding = part
+
+        result, data = self.imap.uid('FETCH', email_id, f'(BODY.PEEK[{section}])')
+        if result != 'OK':
+            return None
+        raw = next((item[1] for item in data if isinstance(item, tuple)), b"")
+        return {
+            "id": email_id,
+            "message": _HEADER_PARSER.parsebytes(literals[0][1]),
+            "payload": self._decode_transfer(raw, encoding),
+            "charset": charset,
+            "received": self._internaldate_iso(response)
+        }
+
+    def _fetch_full_text(self, email_id: bytes) -> Optional[Dict[str, Any]]:
+        """Fetch header fields and the whole body text, then pick the part locally."""
+        result, data = self.imap.uid('FETCH', email_id, FETCH_MESSAGE_PARTS)
+        if result != 'OK' or not data:
+            return None
+        header, text = b"", b""
+        for item in data:
+            if isinstance(item, tuple):
+                if b"HEADER" in item[0].upper():
+                    header = item[1]
+                else:
+                    text = item[1]
+        response = b" ".join(item[0] if isinstance(item, tuple) else item for item in data)
+        msg = email.message_from_bytes(header + text, policy=policy.default)
+        part = msg.get_body(preferencelist=('plain', 'html'))
+        return {
+            "id": email_id,
+            "message": msg,
+            "payload": (part.get_payload(decode=True) or b"") if part else b"",
+            "charset": part.get_content_charset() if part else None,
+            "received": self._internaldate_iso(response)
+        }
+
+    @staticmethod
+    def _internaldate_iso(response: bytes) -> Optional[str]:
+        """UTC ISO timestamp of the INTERNALDATE in a FETCH response, if any."""
+        received = imaplib.Internaldate2tuple(response)
+        if received is None:
+            return None
+        return datetime.fromtimestamp(time.mktime(received), timezone.utc).isoformat()
+
+    @staticmethod
+    def _parse_bodystructure(response: bytes) -> Optional[list]:
+        """Parse the BODYSTRUCTURE value in a FETCH response into nested lists."""
+        start = response.upper().find(b"BODYSTRUCTURE")
+        if start < 0:
+            return None
+
+        stack: List[list] = [[]]
+        for match in BODYSTRUCTURE_TOKEN_RE.finditer(response, start + len(b"BODYSTRUCTURE")):
+            token = match.group(0)
+            if token == b"(":
+                stack.append([])
+            elif token == b")":
+                if len(stack) == 1:
+                    break
+                done = stack.pop()
+                stack[-1].append(done)
+                if len(stack) == 1:
+                    break
+            elif match.group(1) is not None:
+                stack[-1].append(re.sub(rb'\\(.)', rb'\1', match.group(1)).decode('utf-8', errors='replace'))
+            else:
+                stack[-1].append(None if token.upper() == b"NIL" else token.decode('ascii', errors='replace'))
+        return stack[0][0] if stack[0] and isinstance(stack[0][0], list) else None
+
+    def _select_text_part(self, structure: list) -> Optional[Tuple[str, Optional[str], str]]:
+        """(section, charset, transfer encoding) of the first plain, else HTML, part."""
+        parts = list(self._text_parts(structure, ()))
+        for subtype in ("PLAIN", "HTML"):
+            for part_subtype, section, charset, encoding in parts:
+                if part_subtype == subtype:
+                    return section, charset, encoding
+        return None
+
+    def _text_parts(self, structure: list, path: Tuple[int, ...]):
+        """Yield (subtype, section, charset, encoding) for each text/* leaf."""
+        if structure and isinstance(structure[0], list):
+            # Multipart: child bodies come first, then the subtype and extensions
+            for index, child in enumerate(structure, 1):
+                if not isinstance(child, list):
+                    break
+                yield from self._text_parts(child, path + (index,))
+            return
+
+        if len(structure) < 6 or str(structure[0]).upper() != "TEXT":
+            return
+        params = structure[2] if isinstance(structure[2], list) else []
+        charset = next(
+            (params[i + 1] for i in range(0, len(params) - 1, 2)
+             if str(params[i]).upper() == "CHARSET"),
+            None
+        )
+        section = ".".join(str(i) for i in path) or "1"
+        yield str(structure[1]).upper(), section, charset, str(structure[5] or "7BIT").upper()
+
+    @staticmethod
+    def _decode_transfer(raw: bytes, encoding: str) -> bytes:
+        """Undo a part's Content-Transfer-Encoding."""
+        try:
+            if encoding == "BASE64":
+                return base64.b64decode(raw)
+            if encoding == "QUOTED-PRINTABLE":
+                return quopri.decodestring(raw)
+        except (binascii.Error, ValueError):
+            logger.warning(f"Failed to decode {encoding} body part")
+        return raw
+
+    def _get_email_body(self, payload: bytes, charset: Optional[str],
+                        marker: Optional[bytes] = None) -> str:
+        """
+        Charset-decode a transfer-decoded text part.
+
+        If ``marker`` is given and the bytes don't contain it
+        (case-insensitively), returns "" without decoding.
+        """
+        if marker and marker not in payload.lower():
+            return ""
+        try:
+            return payload.decode(charset or 'utf-8', errors='replace').strip()
+        except LookupError:
+            # Unknown charset
+            return payload.decode('utf-8', errors='ignore').strip()
 
     # Additional utility methods remain unchanged...
     # (test_connection, get_inbox_statistics, get_verification_history)
-
-def retry_imap(max_retries=3):
-    """Decorator for IMAP operation retries."""
-    def decorator(func):
-        @wraps(func)
-        def wrapper(self, *args, **kwargs):
-            for attempt in range(max_retries):
-                try:
-                    if not self.is_connected:
-                        self.connect()
-                    return func(self, *args, **kwargs)
-                except (imaplib.IMAP4.abort, ConnectionError) as e:
-                    if attempt == max_retries - 1:
-                        raise
-                    self._safe_disconnect()
-                    time.sleep(1)
-                except Exception as e:
-                    logger.error(f"Operation failed: {str(e)}")
-                    raise
-        return wrapper
-    return decorator
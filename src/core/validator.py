@@ -1,17 +1,30 @@
 """Main validation logic for Reddit persona verification."""
 
 import os
+import re
+import copy
+import asyncio
 import time
 import logging
+import threading
+import functools
+import weakref
+import hashlib
+import json
 import yaml
+import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
-from typing import Dict, Optional, Tuple, List, Any, Union, Type
+from typing import Dict, Optional, Tuple, List, Any, Union, Type, Iterator, AsyncIterator
 from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from ratelimit import limits, sleep_and_retry
 
 from ..utils.proxy_rotator import ProxyRotator
 from ..utils.cookie_manager import CookieManager
 from .browser_engine import BrowserEngine
-from .email_verifier import EmailVerifier, VerificationResult
+from .email_verifier import EmailVerifier, VerificationResult, NO_VERIFICATION_FOUND, VERIFICATION_TIMEOUT
 from ..analysis.scorer import PersonaScorer
 from ..analysis.base_analyzer import BaseAnalyzer
 from ..analysis.deepseek_analyzer import DeepSeekAnalyzer
@@ -20,7 +33,103 @@ from ..analysis.mock_analyzer import MockAnalyzer
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Public profile endpoint, answers with karma/age/flags without a browser
+ABOUT_JSON_URL = "https://www.reddit.com/user/{username}/about.json"
+
+# Reddit usernames: 3-20 letters, digits, underscores or hyphens
+USERNAME_RE = re.compile(r"[A-Za-z0-9_-]{3,20}")
+
+# One rotator per proxy setup, so each validator doesn't start its own health-check thread
+_proxy_rotators: Dict[Tuple[str, str], ProxyRotator] = {}
+_proxy_rotators_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_config(config_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML config file; cached until the file's mtime or size changes."""
+    with open(config_path, 'rb') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _close_browser_engines(engines: List[BrowserEngine]) -> None:
+    """Close every browser engine a validator started."""
+    for engine in engines:
+        try:
+            engine.close()
+        except Exception as e:
+            logger.warning("Failed to close browser engine: %s", e)
+
+
+def _shared_proxy_rotator(proxy_config: Dict[str, Any]) -> ProxyRotator:
+    """Return the ProxyRotator for this proxy config, creating it on first use."""
+    key = (repr(sorted(proxy_config.items())), os.getenv("PROXY_LIST", ""))
+    with _proxy_rotators_lock:
+        rotator = _proxy_rotators.get(key)
+        if rotator is None:
+            rotator = _proxy_rotators[key] = ProxyRotator(proxy_config)
+        return rotator
+
+
+def clear_proxy_rotators() -> None:
+    """Forget the shared ProxyRotators, so the next validator creates its own (e.g. between tests)."""
+    with _proxy_rotators_lock:
+        _proxy_rotators.clear()
+
+
+class _CircuitBreaker:
+    """
+    Fail-fast guard for a component that keeps failing.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    allow() refuses calls for ``cooldown`` seconds. Then a single trial call
+    is let through (half-open): success closes the breaker, failure re-opens it.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, cooldown: float = 60.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether the component may be called now."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial_running or time.monotonic() - self._opened_at < self.cooldown:
+                return False
+            self._trial_running = True
+            return True
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the breaker at the threshold."""
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.warning("%s failed %s times in a row, pausing calls for %ss",
+                                   self.name, self._failures, self.cooldown)
+                self._opened_at = time.monotonic()
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Structured result of the validation process."""
     username: str
@@ -68,21 +177,160 @@ class RedditPersonaValidator:
         """
         self.config = self._load_config(config_path)
 
+        # Email verifiers and persona scorers, checked out one per stage and
+        # reused across validations; concurrent validations each get their
+        # own, so no IMAP session or scorer is shared between threads
+        self._email_verifiers: List[EmailVerifier] = []
+        self._idle_email_verifiers: List[EmailVerifier] = []
+        self._persona_scorers: List[PersonaScorer] = []
+        self._idle_persona_scorers: List[PersonaScorer] = []
+        self._clients_lock = threading.Lock()
+
+        # Warm browser engines, checked out one per extraction and kept open
+        # across validations until close(); closed at exit if never closed.
+        # At most max_workers are open or starting at once.
+        self._browser_engines: List[BrowserEngine] = []
+        self._idle_browsers: List[BrowserEngine] = []
+        self._browsers_starting = 0
+        self._browsers_lock = threading.Lock()
+        self._browsers_available = threading.Condition(self._browsers_lock)
+        weakref.finalize(self, _close_browser_engines, self._browser_engines)
+
+        # Reddit lookups share one rate limit across validate_many workers
+        reddit_config = self.config.get("reddit", {})
+        self._reddit_rate_limit = sleep_and_retry(
+            limits(calls=reddit_config.get("rate_limit_calls", 600),
+                   period=reddit_config.get("rate_limit_period", 600))(lambda: None)
+        )
+
+        # Per-username account info cache: {username: (timestamp, info)}
+        scoring_config = self.config.get("scoring", {})
+        self.account_cache_ttl = scoring_config.get("account_cache_ttl", 300)
+        self.account_cache_size = scoring_config.get("account_cache_size", 128)
+        self._account_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # One keep-alive HTTP session for about.json lookups, shared by all workers
+        self._http = self._create_http_session()
+
+        # Usernames Reddit reported as nonexistent: {username: timestamp}
+        self.missing_account_ttl = scoring_config.get("missing_account_ttl", 600)
+        self.missing_account_cache_size = scoring_config.get("missing_account_cache_size", 1024)
+        self._missing_accounts: OrderedDict = OrderedDict()
+
+        # AI analysis results keyed by a fingerprint of their inputs: {fingerprint: result}
+        analysis_config = self.config.get("analysis", {})
+        self.analysis_cache_size = 0 if analysis_config.get("disable_cache", False) else analysis_config.get("ai_cache_size", 512)
+        self._analysis_cache: OrderedDict = OrderedDict()
+
+        # Second tier on disk so analyses survive restarts, if result caching is enabled
+        ai_config = self.config.get("ai", {})
+        disk_cache_enabled = ai_config.get("cache_results", False) or analysis_config.get("cache_enabled", False)
+        self.analysis_cache_dir = (
+            Path(analysis_config.get("cache_dir", ".cache/analysis"))
+            if disk_cache_enabled and not analysis_config.get("disable_cache", False) else None
+        )
+        self.analysis_cache_expiry = ai_config.get("cache_expiry", 86400)
+
+        # Fail fast on components that keep failing instead of paying their timeouts
+        breaker_config = self.config.get("circuit_breaker", {})
+        breaker_options = {
+            "failure_threshold": breaker_config.get("failure_threshold", 5),
+            "cooldown": breaker_config.get("cooldown", 60)
+        }
+        self._browser_breaker = _CircuitBreaker("Browser engine", **breaker_options)
+        self._email_breaker = _CircuitBreaker("Email verifier", **breaker_options)
+        self._scorer_breaker = _CircuitBreaker("Persona scorer", **breaker_options)
+
+        # Default pool size for batch validation
+        self.max_workers = self.config.get("concurrency", {}).get("max_workers", 4)
+
+        # Long-lived threads for the email stage of validate(), so it overlaps
+        # the AI call without an event loop per validation; started on first
+        # use and again after close()
+        self._stage_executor: Optional[ThreadPoolExecutor] = None
+        self._stage_executor_lock = threading.Lock()
+
+        # Account thresholds: (account_info field, minimum, warning template)
+        self._thresholds = (
+            ("age_days", scoring_config.get("min_account_age_days", 30), "Account age below threshold ({} days)"),
+            ("karma", scoring_config.get("min_karma", 100), "Account karma below threshold ({})")
+        )
+
+        # Trust score weights, read once; the weights used without AI analysis
+        # are renormalized here rather than on every score
+        self._email_weight = float(scoring_config.get("email_verification_weight", 0.3))
+        self._age_weight = float(scoring_config.get("account_age_weight", 0.2))
+        self._karma_weight = float(scoring_config.get("karma_weight", 0.2))
+        self._ai_weight = float(scoring_config.get("ai_analysis_weight", 0.3))
+        base_total = (self._email_weight + self._age_weight + self._karma_weight) or 1.0
+        self._base_weights = (
+            self._email_weight / base_total,
+            self._age_weight / base_total,
+            self._karma_weight / base_total
+        )
+
         # Initialize dependencies
         self.proxy_rotator = self._init_proxy_rotator()
-        self.browser_engine = None  # Lazy initialization
         self.email_verifier = None  # Lazy initialization
         self.persona_scorer = None  # Lazy initialization
 
-        # Set up logging
-        log_level = self.config.get("interface", {}).get("cli", {}).get("log_level", "INFO")
-        logging.basicConfig(
-            level=getattr(logging, log_level),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        # Set up logging, unless the embedding application already has
+        if not logging.getLogger().hasHandlers():
+            log_level = self.config.get("interface", {}).get("cli", {}).get("log_level", "INFO")
+            logging.basicConfig(
+                level=getattr(logging, log_level),
+                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
 
         logger.info("Reddit Persona Validator initialized")
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def email_verifier(self) -> Optional[EmailVerifier]:
+        """The first email verifier created, if any."""
+        return self._email_verifiers[0] if self._email_verifiers else None
+
+    @email_verifier.setter
+    def email_verifier(self, value: Optional[EmailVerifier]) -> None:
+        """Use ``value`` as the only pooled email verifier (None empties the pool)."""
+        with self._clients_lock:
+            self._email_verifiers[:] = [value] if value is not None else []
+            self._idle_email_verifiers[:] = self._email_verifiers
+
+    @property
+    def persona_scorer(self) -> Optional[PersonaScorer]:
+        """The first persona scorer created, if any."""
+        return self._persona_scorers[0] if self._persona_scorers else None
+
+    @persona_scorer.setter
+    def persona_scorer(self, value: Optional[PersonaScorer]) -> None:
+        """Use ``value`` as the only pooled persona scorer (None empties the pool)."""
+        with self._clients_lock:
+            self._persona_scorers[:] = [value] if value is not None else []
+            self._idle_persona_scorers[:] = self._persona_scorers
+
+    def _create_http_session(self) -> requests.Session:
+        """
+        Create the shared requests Session for Reddit's public endpoints.
+
+        The connection pool blocks at ``reddit.max_connections`` so concurrent
+        workers reuse keep-alive connections instead of opening new ones.
+        """
+        reddit_config = self.config.get("reddit", {})
+        session = requests.Session()
+        session.headers["User-Agent"] = reddit_config.get("user_agent", "RedditPersonaValidator/1.0.0")
+
+        max_connections = reddit_config.get("max_connections", 10)
+        adapter = HTTPAdapter(pool_maxsize=max_connections, pool_block=True)
+        session.mount("https://", adapter)
+        return session
+
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """
         Load configuration from YAML file.
@@ -102,12 +350,14 @@ class RedditPersonaValidator:
             if not config_file.exists():
                 raise FileNotFoundError(f"Config file not found: {config_path}")
 
-            with open(config_file, 'r') as f:
-                config = yaml.safe_load(f)
+            # Batch runs build a validator per account; only re-parse when the file changes
+            stat = config_file.stat()
+            config = _parse_config(str(config_file.resolve()), stat.st_mtime_ns, stat.st_size)
 
-            return config
+            # Callers may mutate their config, so never hand out the cached dict
+            return copy.deepcopy(config)
         except Exception as e:
-            logger.error(f"Failed to load config: {str(e)}")
+            logger.error("Failed to load config: %s", e)
             raise
 
     def _init_proxy_rotator(self) -> Optional[ProxyRotator]:
@@ -118,71 +368,138 @@ class RedditPersonaValidator:
                 logger.info("No proxy configuration found, running without proxies")
                 return None
 
-            return ProxyRotator(proxy_config)
+            return _shared_proxy_rotator(proxy_config)
         except Exception as e:
-            logger.warning(f"Failed to initialize proxy rotator: {str(e)}")
+            logger.warning("Failed to initialize proxy rotator: %s", e)
             return None
 
     def _init_browser_engine(self) -> BrowserEngine:
-        """Lazy initialization of browser engine."""
-        if self.browser_engine is None:
+        """
+        Check out an idle browser engine, creating one if none is free.
+
+        Blocks while ``max_workers`` engines are already checked out.
+        """
+        with self._browsers_available:
+            while (not self._idle_browsers and
+                   len(self._browser_engines) + self._browsers_starting >= self.max_workers):
+                self._browsers_available.wait()
+            if self._idle_browsers:
+                return self._idle_browsers.pop()
+            self._browsers_starting += 1
+
+        try:
             browser_config = self.config.get("reddit", {})
-            self.browser_engine = BrowserEngine(
+            engine = BrowserEngine(
                 config=browser_config,
                 proxy_rotator=self.proxy_rotator
             )
-        return self.browser_engine
+        except Exception:
+            with self._browsers_available:
+                self._browsers_starting -= 1
+                self._browsers_available.notify()
+            raise
+
+        with self._browsers_available:
+            self._browsers_starting -= 1
+            self._browser_engines.append(engine)
+        return engine
+
+    def _release_browser_engine(self, engine: BrowserEngine, healthy: bool = True) -> None:
+        """
+        Return a checked-out browser engine for reuse.
+
+        An engine whose lookup failed is closed and dropped from the pool
+        instead, so the next extraction starts a fresh session.
+        """
+        with self._browsers_available:
+            if healthy:
+                self._idle_browsers.append(engine)
+            elif engine in self._browser_engines:
+                self._browser_engines.remove(engine)
+            self._browsers_available.notify()
+
+        if not healthy:
+            _close_browser_engines([engine])
 
     def _init_email_verifier(self) -> EmailVerifier:
-        """Lazy initialization of email verifier."""
-        if self.email_verifier is None:
-            email_config = self.config.get("email", {})
-            self.email_verifier = EmailVerifier(email_config)
-        return self.email_verifier
+        """Check out an idle email verifier, creating one if none is free."""
+        with self._clients_lock:
+            if self._idle_email_verifiers:
+                return self._idle_email_verifiers.pop()
+
+            verifier = EmailVerifier(self.config.get("email", {}))
+            self._email_verifiers.append(verifier)
+            return verifier
+
+    def _release_email_verifier(self, verifier: EmailVerifier) -> None:
+        """Return a checked-out email verifier for reuse."""
+        with self._clients_lock:
+            self._idle_email_verifiers.append(verifier)
 
     def _init_persona_scorer(self) -> PersonaScorer:
         """
-        Lazy initialization of persona scorer with AI configuration.
+        Check out an idle persona scorer, creating one with the AI
+        configuration if none is free.
 
         Returns:
             Configured PersonaScorer instance
         """
-        if self.persona_scorer is None:
-            # Get analysis configuration
-            analysis_config = self.config.get("analysis", {})
-            ai_config = self.config.get("ai", {})
-
-            # Determine analyzer type and fallback
-            analyzer_type = ai_config.get("default_analyzer") or analysis_config.get("default_analyzer", "deepseek")
-            fallback_analyzer = ai_config.get("fallback_analyzer", "mock")
-            mock_mode = analysis_config.get("mock_mode", False)
-
-            # Extract scoring weights
-            scoring_weights = ai_config.get("weights", {})
-
-            # Configure caching
-            cache_enabled = ai_config.get("cache_results", False) or analysis_config.get("cache_enabled", False)
-            cache_expiry = ai_config.get("cache_expiry", 86400)  # Default: 24 hours
-
-            # Initialize scorer with configuration
-            self.persona_scorer = PersonaScorer(
-                analyzer_type=analyzer_type,
-                mock_mode=mock_mode,
-                fallback_analyzer=fallback_analyzer,
-                scoring_weights=scoring_weights
+        with self._clients_lock:
+            if self._idle_persona_scorers:
+                return self._idle_persona_scorers.pop()
+
+        # Get analysis configuration
+        analysis_config = self.config.get("analysis", {})
+        ai_config = self.config.get("ai", {})
+
+        # Determine analyzer type and fallback
+        analyzer_type = ai_config.get("default_analyzer") or analysis_config.get("default_analyzer", "deepseek")
+        fallback_analyzer = ai_config.get("fallback_analyzer", "mock")
+        mock_mode = analysis_config.get("mock_mode", False)
+
+        # Extract scoring weights
+        scoring_weights = ai_config.get("weights", {})
+
+        # Configure caching
+        cache_enabled = ai_config.get("cache_results", False) or analysis_config.get("cache_enabled", False)
+        cache_expiry = ai_config.get("cache_expiry", 86400)  # Default: 24 hours
+
+        # Initialize scorer with configuration
+        scorer = PersonaScorer(
+            analyzer_type=analyzer_type,
+            mock_mode=mock_mode,
+            fallback_analyzer=fallback_analyzer,
+            scoring_weights=scoring_weights
+        )
+
+        # Configure additional options
+        if hasattr(scorer, "set_cache_options") and callable(getattr(scorer, "set_cache_options")):
+            scorer.set_cache_options(
+                enabled=cache_enabled,
+                expiry=cache_expiry,
+                cache_dir=analysis_config.get("cache_dir", ".cache/analysis")
             )
 
-            # Configure additional options
-            if hasattr(self.persona_scorer, "set_cache_options") and callable(getattr(self.persona_scorer, "set_cache_options")):
-                self.persona_scorer.set_cache_options(
-                    enabled=cache_enabled,
-                    expiry=cache_expiry,
-                    cache_dir=analysis_config.get("cache_dir", ".cache/analysis")
-                )
+        logger.info("Initialized PersonaScorer with %s analyzer (fallback: %s)", analyzer_type, fallback_analyzer)
 
-            logger.info(f"Initialized PersonaScorer with {analyzer_type} analyzer (fallback: {fallback_analyzer})")
+        with self._clients_lock:
+            self._persona_scorers.append(scorer)
+        return scorer
 
-        return self.persona_scorer
+    def _release_persona_scorer(self, scorer: PersonaScorer) -> None:
+        """Return a checked-out persona scorer for reuse."""
+        with self._clients_lock:
+            self._idle_persona_scorers.append(scorer)
+
+    def _get_stage_executor(self) -> ThreadPoolExecutor:
+        """The executor for validate()'s email stage, started if needed."""
+        with self._stage_executor_lock:
+            if self._stage_executor is None:
+                self._stage_executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="validator-stage"
+                )
+            return self._stage_executor
 
     def validate(self,
                 username: str,
@@ -194,6 +511,11 @@ class RedditPersonaValidator:
         """
         Perform comprehensive validation of a Reddit persona.
 
+        Email verification (IMAP wait) and AI analysis (LLM call) only depend
+        on the account info; when both are requested the email check runs on
+        the validator's stage executor while the analysis runs on the calling
+        thread. Async callers should await validate_async instead.
+
         Args:
             username: Reddit username to validate
             email_address: Email address for verification (optional)
@@ -205,9 +527,9 @@ class RedditPersonaValidator:
         Returns:
             ValidationResult containing all validation results
         """
-        logger.info(f"Starting validation for username: {username}")
+        logger.info("Starting validation for username: %s", username)
         if ai_analyzer_type:
-            logger.info(f"Using AI analyzer override: {ai_analyzer_type}")
+            logger.info("Using AI analyzer override: %s", ai_analyzer_type)
 
         result = ValidationResult(
             username=username,
@@ -217,78 +539,272 @@ class RedditPersonaValidator:
         )
 
         try:
+            # Malformed usernames can't exist, don't start a browser for them
+            if not USERNAME_RE.fullmatch(username or ""):
+                result.errors.append(f"Invalid Reddit username format: '{username}'")
+                return result
+
             # 1. Extract Reddit account info
             account_info = self._extract_account_info(username)
-
-            if not account_info.get("exists", False):
-                result.errors.append(f"Reddit account '{username}' does not exist")
+            if not self._apply_account_info(result, account_info):
                 return result
 
-            result.exists = True
-            result.account_details = account_info
-            # Add warnings from account_info if present
-            if "warnings" in account_info:
-                result.warnings.extend(account_info["warnings"])
+            # 2. + 3. Verify email and perform AI analysis, as requested
+            verify_email = perform_email_verification and email_address
+            analyze = perform_ai_analysis and self.config.get("ai", {}).get("enabled", True)
 
-            # 2. Verify email if requested
-            if perform_email_verification and email_address:
-                email_result = self._verify_email(username, email_address)
-                result.email_verified = email_result.verified
-                result.email_details = {
-                    "email": email_result.email,
-                    "verified": email_result.verified,
-                    "verification_time": email_result.verification_time,
-                    "verification_id": email_result.verification_id,
-                    "error": email_result.error
-                }
+            email_future = None
+            if verify_email and analyze:
+                email_future = self._get_stage_executor().submit(self._verify_email, username, email_address)
 
-                if not email_result.verified:
-                    result.warnings.append(f"Email verification failed: {email_result.error}")
+            # One stage failing must not lose the other's result
+            email_result = analysis_result = None
+            if verify_email and email_future is None:
+                try:
+                    email_result = self._verify_email(username, email_address)
+                except Exception as e:
+                    email_result = e
 
-            # 3. Perform AI analysis if requested
-            ai_enabled = self.config.get("ai", {}).get("enabled", True)
-            ai_analysis_result = None
-            if perform_ai_analysis and ai_enabled:
-                # Override analyzer type if specified
-                if ai_analyzer_type:
-                    if hasattr(self.persona_scorer, "analyzer_type"):
-                        original_analyzer_type = self.persona_scorer.analyzer_type
-                        self.persona_scorer.analyzer_type = ai_analyzer_type
+            if analyze:
+                try:
+                    analysis_result = self._analyze_persona(
+                        account_info,
+                        detail_level=ai_detail_level,
+                        analyzer_type=ai_analyzer_type
+                    )
+                except Exception as e:
+                    analysis_result = e
+
+            if email_future is not None:
+                try:
+                    email_result = email_future.result()
+                except Exception as e:
+                    email_result = e
+
+            # 4. Calculate final trust score
+            self._apply_stage_results(result, account_info, email_result, analysis_result)
+
+            logger.info("Validation completed for %s", username)
+            return result
+
+        except Exception as e:
+            logger.error("Validation failed: %s", e, exc_info=True)
+            result.errors.append(f"Validation error: {str(e)}")
+            return result
+        finally:
+            # Clean up resources
+            self._cleanup()
+
+    async def validate_async(self,
+                             username: str,
+                             email_address: Optional[str] = None,
+                             perform_email_verification: bool = False,
+                             perform_ai_analysis: bool = True,
+                             ai_analyzer_type: Optional[str] = None,
+                             ai_detail_level: str = "medium") -> ValidationResult:
+        """
+        Awaitable validate for use inside an event loop.
+
+        The blocking stages run in worker threads, with email verification
+        (IMAP wait) and AI analysis (LLM call) gathered concurrently once the
+        account info is fetched.
+
+        Args:
+            username: Reddit username to validate
+            email_address: Email address for verification (optional)
+            perform_email_verification: Whether to verify email
+            perform_ai_analysis: Whether to perform AI analysis
+            ai_analyzer_type: Specific AI analyzer to use (overrides config)
+            ai_detail_level: Level of AI analysis detail (none, basic, medium, full)
+
+        Returns:
+            ValidationResult containing all validation results
+        """
+        logger.info("Starting validation for username: %s", username)
+        if ai_analyzer_type:
+            logger.info("Using AI analyzer override: %s", ai_analyzer_type)
 
-                # Perform analysis with specified detail level
-                analysis_result = self._analyze_persona(
+        result = ValidationResult(
+            username=username,
+            exists=False,
+            errors=[],
+            warnings=[]
+        )
+
+        try:
+            # Malformed usernames can't exist, don't start a browser for them
+            if not USERNAME_RE.fullmatch(username or ""):
+                result.errors.append(f"Invalid Reddit username format: '{username}'")
+                return result
+
+            # 1. Extract Reddit account info
+            account_info = await asyncio.to_thread(self._extract_account_info, username)
+            if not self._apply_account_info(result, account_info):
+                return result
+
+            # 2. + 3. Verify email and perform AI analysis, as requested, concurrently
+            stages = {}
+            if perform_email_verification and email_address:
+                stages["email"] = self._verify_email_async(username, email_address)
+
+            if perform_ai_analysis and self.config.get("ai", {}).get("enabled", True):
+                stages["ai"] = asyncio.to_thread(
+                    self._analyze_persona,
                     account_info,
-                    detail_level=ai_detail_level
+                    detail_level=ai_detail_level,
+                    analyzer_type=ai_analyzer_type
                 )
-                result.ai_analysis = analysis_result.get("ai_analysis")
-                ai_analysis_result = result.ai_analysis
-                # If AI analysis failed, add warning
-                if ai_analysis_result and "error" in ai_analysis_result:
-                    result.warnings.append(f"AI analysis failed: {ai_analysis_result.get('error')}")
 
-                # Restore original analyzer type if it was overridden
-                if ai_analyzer_type and hasattr(self.persona_scorer, "analyzer_type"):
-                    self.persona_scorer.analyzer_type = original_analyzer_type
-
-            # 4. Calculate final trust score (always run, regardless of AI analysis success)
-            trust_score = self._calculate_trust_score(
-                account_info,
-                email_verified=result.email_verified,
-                ai_score=(result.ai_analysis.get("viability_score") if result.ai_analysis else None),
-                ai_analysis=result.ai_analysis
-            )
-            result.trust_score = trust_score
+            # One stage failing must not cancel the other
+            outcomes = dict(zip(stages, await asyncio.gather(*stages.values(), return_exceptions=True)))
 
-            logger.info(f"Validation completed for {username}")
+            # 4. Calculate final trust score
+            self._apply_stage_results(result, account_info, outcomes.get("email"), outcomes.get("ai"))
+
+            logger.info("Validation completed for %s", username)
             return result
 
         except Exception as e:
-            logger.error(f"Validation failed: {str(e)}", exc_info=True)
+            logger.error("Validation failed: %s", e, exc_info=True)
             result.errors.append(f"Validation error: {str(e)}")
             return result
         finally:
-            # Clean up resources
-            self._cleanup()
+            # Clean up resources off the loop
+            await asyncio.to_thread(self._cleanup)
+
+    def _apply_account_info(self, result: ValidationResult, account_info: Dict[str, Any]) -> bool:
+        """
+        Record extracted account info on the result.
+
+        Returns:
+            False if validation stops here (account missing, lookup failed or
+            below the early-reject gate)
+        """
+        if not account_info.get("exists", False):
+            error = account_info.get("error")
+            if error and error != "Account not found":
+                result.errors.append(f"Could not look up Reddit account '{result.username}': {error}")
+            else:
+                result.errors.append(f"Reddit account '{result.username}' does not exist")
+            return False
+
+        result.exists = True
+        result.account_details = account_info
+        # Add warnings from account_info if present
+        if "warnings" in account_info:
+            result.warnings.extend(account_info["warnings"])
+
+        # Accounts under both early-reject thresholds can't earn a useful
+        # score, so skip the email wait and the AI call entirely
+        if self._fails_early_reject(account_info):
+            logger.info("Account %s below early-reject thresholds, skipping further checks", result.username)
+            result.warnings.append("Account below early-reject thresholds; email verification and AI analysis skipped")
+            result.trust_score = 0.0
+            return False
+
+        return True
+
+    def _apply_stage_results(self,
+                             result: ValidationResult,
+                             account_info: Dict[str, Any],
+                             email_result: Union[VerificationResult, Exception, None],
+                             analysis_result: Union[Dict[str, Any], Exception, None]) -> None:
+        """
+        Record email and AI stage outcomes (a result, the exception it raised,
+        or None if not run) and the final trust score.
+        """
+        if isinstance(email_result, Exception):
+            result.errors.append(f"Email verification error: {str(email_result)}")
+        elif email_result is not None:
+            result.email_verified = email_result.verified
+            result.email_details = {
+                "email": email_result.email,
+                "verified": email_result.verified,
+                "verification_time": email_result.verification_time,
+                "verification_id": email_result.verification_id,
+                "error": email_result.error
+            }
+
+            if not email_result.verified:
+                result.warnings.append(f"Email verification failed: {email_result.error}")
+
+        if isinstance(analysis_result, Exception):
+            result.errors.append(f"AI analysis error: {str(analysis_result)}")
+        elif analysis_result is not None:
+            result.ai_analysis = analysis_result.get("ai_analysis")
+            # If AI analysis failed, add warning
+            if result.ai_analysis and "error" in result.ai_analysis:
+                result.warnings.append(f"AI analysis failed: {result.ai_analysis.get('error')}")
+
+        # Always run, regardless of AI analysis success
+        result.trust_score = self._calculate_trust_score(
+            account_info,
+            email_verified=result.email_verified,
+            ai_score=(result.ai_analysis.get("viability_score") if result.ai_analysis else None),
+            ai_analysis=result.ai_analysis
+        )
+
+    def validate_many(self,
+                      batch: List[Dict[str, Any]],
+                      max_workers: Optional[int] = None) -> List[ValidationResult]:
+        """
+        Validate several personas on a bounded thread pool.
+
+        Args:
+            batch: validate() keyword arguments per persona, e.g.
+                {"username": "alice", "email_address": "a@example.com",
+                 "perform_email_verification": True}
+            max_workers: Maximum number of concurrent validations
+                (defaults to concurrency.max_workers from config)
+
+        Returns:
+            ValidationResults in the same order as batch
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as executor:
+            futures = [executor.submit(self.validate, **request) for request in batch]
+            return [future.result() for future in futures]
+
+    def validate_many_stream(self,
+                             batch: List[Dict[str, Any]],
+                             max_workers: Optional[int] = None) -> Iterator[ValidationResult]:
+        """
+        Validate several personas, yielding each result as soon as it is ready.
+
+        Args:
+            batch: validate() keyword arguments per persona (see validate_many)
+            max_workers: Maximum number of concurrent validations
+                (defaults to concurrency.max_workers from config)
+
+        Yields:
+            ValidationResults in completion order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as executor:
+            futures = [executor.submit(self.validate, **request) for request in batch]
+            for future in as_completed(futures):
+                yield future.result()
+
+    async def validate_many_astream(self,
+                                    batch: List[Dict[str, Any]],
+                                    max_concurrency: Optional[int] = None) -> AsyncIterator[ValidationResult]:
+        """
+        Async validate_many_stream for use inside an event loop.
+
+        Args:
+            batch: validate_async() keyword arguments per persona (see validate_many)
+            max_concurrency: Maximum number of concurrent validations
+                (defaults to concurrency.max_workers from config)
+
+        Yields:
+            ValidationResults in completion order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_workers)
+
+        async def run(request: Dict[str, Any]) -> ValidationResult:
+            async with semaphore:
+                return await self.validate_async(**request)
+
+        for next_result in asyncio.as_completed([run(request) for request in batch]):
+            yield await next_result
 
     def _extract_account_info(self, username: str) -> Dict[str, Any]:
         """
@@ -297,15 +813,61 @@ class RedditPersonaValidator:
         Args:
             username: Reddit username
 
+        Results are cached per username for ``account_cache_ttl`` seconds, so
+        revalidating the same account skips the browser start-up entirely.
+
         Returns:
             Dictionary with account metrics
         """
-        logger.info(f"Extracting account info for {username}")
+        cached = self._get_cached_account(username)
+        if cached is not None:
+            logger.debug("Using cached account info for %s", username)
+            return cached
+
+        if self._is_known_missing(username):
+            logger.debug("Account %s recently reported as nonexistent", username)
+            return {"exists": False, "error": "Account not found"}
+
+        logger.info("Extracting account info for %s", username)
 
         try:
-            browser = self._init_browser_engine()
-            with browser:
-                account_info = browser.extract_account_info(username)
+            self._reddit_rate_limit()
+            account_info = None
+            if self.config.get("reddit", {}).get("json_fast_path", True):
+                account_info = self._extract_account_info_fast(username)
+
+            if account_info is None:
+                if not self._browser_breaker.allow():
+                    return {"exists": False, "error": "Browser engine unavailable after repeated failures"}
+
+                # The engine starts its session on first use and stays warm afterwards.
+                # The batch path loads the profile and communities pages in parallel
+                # tabs instead of one after the other.
+                # A browser that fails to start counts against the breaker too,
+                # which also settles a half-open trial
+                try:
+                    browser = self._init_browser_engine()
+                    healthy = False
+                    try:
+                        account_info = browser.extract_account_info_batch([username])[username]
+                        healthy = "error" not in account_info
+                    finally:
+                        self._release_browser_engine(browser, healthy=healthy)
+                except Exception:
+                    self._browser_breaker.record_failure()
+                    raise
+
+                # A tab that failed to load or parse comes back as an error
+                # record; that says nothing about whether the account exists
+                if "error" in account_info:
+                    self._browser_breaker.record_failure()
+                    logger.warning("Browser extraction failed for %s: %s", username, account_info["error"])
+                    return account_info
+                self._browser_breaker.record_success()
+
+            if not account_info.get("exists", False):
+                self._remember_missing(username)
+                return account_info
 
             # Convert karma to int if possible
             if account_info.get("karma") and isinstance(account_info["karma"], str):
@@ -314,24 +876,143 @@ class RedditPersonaValidator:
                 except ValueError:
                     pass
 
-            # Check account age against threshold
-            min_age = self.config.get("scoring", {}).get("min_account_age_days", 30)
-            if account_info.get("age_days", 0) < min_age:
-                account_info["warnings"] = account_info.get("warnings", [])
-                account_info["warnings"].append(f"Account age below threshold ({min_age} days)")
-
-            # Check karma against threshold
-            min_karma = self.config.get("scoring", {}).get("min_karma", 100)
-            if account_info.get("karma", 0) < min_karma:
-                account_info["warnings"] = account_info.get("warnings", [])
-                account_info["warnings"].append(f"Account karma below threshold ({min_karma})")
+            # Check account age and karma against thresholds
+            below = [message.format(minimum) for field, minimum, message in self._thresholds
+                     if account_info.get(field, 0) < minimum]
+            if below:
+                account_info.setdefault("warnings", []).extend(below)
 
+            self._cache_account(username, account_info)
             return account_info
 
         except Exception as e:
-            logger.error(f"Failed to extract account info: {str(e)}", exc_info=True)
+            logger.error("Failed to extract account info: %s", e, exc_info=True)
             return {"exists": False, "error": str(e)}
 
+    def _extract_account_info_fast(self, username: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch account info from Reddit's public about.json endpoint.
+
+        Communities and trophies are not part of that payload and are left
+        empty.
+
+        Args:
+            username: Reddit username
+
+        Returns:
+            Account info dictionary, or None when the endpoint gave no usable
+            answer (blocked, rate limited, not found or shadowbanned, unexpected
+            payload) and the browser has to decide
+        """
+        reddit_config = self.config.get("reddit", {})
+        proxies = self.proxy_rotator.get_proxy() if self.proxy_rotator else None
+
+        try:
+            response = self._http.get(
+                ABOUT_JSON_URL.format(username=username),
+                proxies=proxies,
+                timeout=reddit_config.get("request_timeout", 10),
+                allow_redirects=False
+            )
+        except requests.RequestException as e:
+            logger.debug("about.json request failed for %s: %s", username, e)
+            return None
+
+        if response.status_code != 200:
+            logger.debug("about.json returned %s for %s, using browser", response.status_code, username)
+            return None
+
+        try:
+            data = response.json()["data"]
+            post_karma = int(data.get("link_karma", 0))
+            comment_karma = int(data.get("comment_karma", 0))
+            account_info = {
+                "username": data.get("name", username),
+                "exists": True,
+                "karma": int(data.get("total_karma", post_karma + comment_karma)),
+                "post_karma": post_karma,
+                "comment_karma": comment_karma,
+                "age_days": int((time.time() - float(data["created_utc"])) // 86400),
+                "verified": bool(data.get("verified", False)),
+                "verified_email": bool(data.get("has_verified_email", False)),
+                "moderator": bool(data.get("is_mod", False)),
+                "trophies": [],
+                "communities": [],
+                "shadowbanned": False,
+                "warnings": []
+            }
+        except (ValueError, KeyError, TypeError) as e:
+            logger.debug("Unexpected about.json payload for %s: %s", username, e)
+            return None
+
+        return account_info
+
+    def _get_cached_account(self, username: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of fresh cached account info, evicting it if expired."""
+        key = username.lower()
+        with self._cache_lock:
+            entry = self._account_cache.get(key)
+            if entry is None:
+                return None
+
+            cached_at, info = entry
+            if time.time() - cached_at >= self.account_cache_ttl:
+                del self._account_cache[key]
+                return None
+
+            self._account_cache.move_to_end(key)
+            return copy.deepcopy(info)
+
+    def _cache_account(self, username: str, info: Dict[str, Any]) -> None:
+        """Store a copy of account info, evicting the oldest entries."""
+        if self.account_cache_ttl <= 0 or self.account_cache_size <= 0:
+            return
+
+        # Only complete lookups of existing accounts; a failed scrape must be retried
+        if not info.get("exists", False) or "error" in info:
+            return
+
+        key = username.lower()
+        with self._cache_lock:
+            self._account_cache[key] = (time.time(), copy.deepcopy(info))
+            self._account_cache.move_to_end(key)
+            while len(self._account_cache) > self.account_cache_size:
+                self._account_cache.popitem(last=False)
+
+    def _is_known_missing(self, username: str) -> bool:
+        """Whether the account was reported nonexistent within missing_account_ttl."""
+        key = username.lower()
+        with self._cache_lock:
+            cached_at = self._missing_accounts.get(key)
+            if cached_at is None:
+                return False
+
+            if time.time() - cached_at >= self.missing_account_ttl:
+                del self._missing_accounts[key]
+                return False
+
+            self._missing_accounts.move_to_end(key)
+            return True
+
+    def _remember_missing(self, username: str) -> None:
+        """Record a nonexistent account, evicting the oldest entries."""
+        if self.missing_account_ttl <= 0 or self.missing_account_cache_size <= 0:
+            return
+
+        key = username.lower()
+        with self._cache_lock:
+            self._missing_accounts[key] = time.time()
+            self._missing_accounts.move_to_end(key)
+            while len(self._missing_accounts) > self.missing_account_cache_size:
+                self._missing_accounts.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop all in-memory cached account info, known-missing accounts and AI analyses."""
+        with self._cache_lock:
+            self._account_cache.clear()
+            self._missing_accounts.clear()
+            self._analysis_cache.clear()
+
     def _verify_email(self, username: str, email_address: str) -> VerificationResult:
         """
         Verify email ownership using the email verifier.
@@ -343,19 +1024,82 @@ class RedditPersonaValidator:
         Returns:
             VerificationResult containing verification status
         """
-        logger.info(f"Verifying email for {username}: {email_address}")
+        logger.info("Verifying email for %s: %s", username, email_address)
+
+        if not self._email_breaker.allow():
+            return VerificationResult(
+                verified=False,
+                email=email_address,
+                reddit_username=username,
+                error="Email verification unavailable after repeated failures"
+            )
+
+        try:
+            verifier = self._init_email_verifier()
+            try:
+                with verifier:
+                    result = verifier.verify_reddit_account(
+                        username=username,
+                        email_address=email_address,
+                        wait_for_verification=True
+                    )
+            finally:
+                self._release_email_verifier(verifier)
+            self._record_email_outcome(result)
+            return result
+        except Exception as e:
+            self._email_breaker.record_failure()
+            logger.error("Email verification failed: %s", e, exc_info=True)
+            return VerificationResult(
+                verified=False,
+                email=email_address,
+                reddit_username=username,
+                error=str(e)
+            )
+
+    async def _verify_email_async(self, username: str, email_address: str) -> VerificationResult:
+        """
+        Awaitable _verify_email for validate_async.
+
+        The verifier is checked out for this call only, so concurrent
+        validations on the same loop never share an IMAP session.
+
+        Args:
+            username: Reddit username
+            email_address: Email address to verify
+
+        Returns:
+            VerificationResult containing verification status
+        """
+        logger.info("Verifying email for %s: %s", username, email_address)
+
+        if not self._email_breaker.allow():
+            return VerificationResult(
+                verified=False,
+                email=email_address,
+                reddit_username=username,
+                error="Email verification unavailable after repeated failures"
+            )
 
         try:
             verifier = self._init_email_verifier()
-            with verifier:
-                result = verifier.verify_reddit_account(
+            try:
+                result = await verifier.verify_reddit_account_async(
                     username=username,
                     email_address=email_address,
                     wait_for_verification=True
                 )
+            finally:
+                # Same release as leaving ``with verifier:``, off the loop
+                try:
+                    await asyncio.to_thread(verifier.disconnect)
+                finally:
+                    self._release_email_verifier(verifier)
+            self._record_email_outcome(result)
             return result
         except Exception as e:
-            logger.error(f"Email verification failed: {str(e)}", exc_info=True)
+            self._email_breaker.record_failure()
+            logger.error("Email verification failed: %s", e, exc_info=True)
             return VerificationResult(
                 verified=False,
                 email=email_address,
@@ -363,25 +1107,37 @@ class RedditPersonaValidator:
                 error=str(e)
             )
 
+    def _record_email_outcome(self, result: VerificationResult) -> None:
+        """
+        Settle the email breaker for a verification result.
+
+        The verifier reports connection, login and protocol failures as an
+        error result rather than raising, so only "nothing found yet" counts
+        as a healthy call.
+        """
+        if result.error and result.error not in (NO_VERIFICATION_FOUND, VERIFICATION_TIMEOUT):
+            self._email_breaker.record_failure()
+        else:
+            self._email_breaker.record_success()
+
     def _analyze_persona(self,
                         account_info: Dict[str, Any],
-                        detail_level: str = "medium") -> Dict[str, Any]:
+                        detail_level: str = "medium",
+                        analyzer_type: Optional[str] = None) -> Dict[str, Any]:
         """
         Perform AI analysis of the persona with configurable detail level.
 
         Args:
             account_info: Account information dictionary
             detail_level: Level of AI analysis detail (none, basic, medium, full)
+            analyzer_type: Specific AI analyzer to use for this call (overrides config)
 
         Returns:
             Dictionary with analysis results
         """
-        logger.info(f"Performing AI analysis for {account_info.get('username')} (detail: {detail_level})")
+        logger.info("Performing AI analysis for %s (detail: %s)", account_info.get('username'), detail_level)
 
         try:
-            # Initialize the scorer
-            scorer = self._init_persona_scorer()
-
             # Get analysis configuration
             analysis_config = self.config.get("analysis", {})
 
@@ -411,14 +1167,54 @@ class RedditPersonaValidator:
                 "sensitive_content_detection": analysis_config.get("sensitive_content_detection", True)
             }
 
-            # Perform analysis with options
-            if hasattr(scorer, "calculate_trust_score_with_options"):
-                return scorer.calculate_trust_score_with_options(account_info, analysis_options)
-            else:
-                return scorer.calculate_trust_score(account_info)
+            # Check out a scorer; it belongs to this call until released
+            scorer = self._init_persona_scorer()
+            original_analyzer_type = None
+
+            try:
+                # Override analyzer type if specified
+                if analyzer_type and hasattr(scorer, "analyzer_type"):
+                    original_analyzer_type = scorer.analyzer_type
+                    scorer.analyzer_type = analyzer_type
+
+                # Identical inputs give the same analysis, skip the LLM call on a hit
+                fingerprint = self._analysis_fingerprint(
+                    account_info, analysis_options, getattr(scorer, "analyzer_type", None)
+                )
+                cached = self._get_cached_analysis(fingerprint)
+                if cached is not None:
+                    logger.debug("Using cached AI analysis for %s", account_info.get('username'))
+                    return cached
+
+                if not self._scorer_breaker.allow():
+                    message = "AI analysis unavailable after repeated failures"
+                    return {"error": message, "ai_analysis": {"error": message, "viability_score": 0}}
+
+                # Perform analysis with options
+                if hasattr(scorer, "calculate_trust_score_with_options"):
+                    analysis = scorer.calculate_trust_score_with_options(account_info, analysis_options)
+                else:
+                    analysis = scorer.calculate_trust_score(account_info)
+
+                # The scorer reports LLM failures as error results, not exceptions
+                failed = "error" in analysis or "error" in (analysis.get("ai_analysis") or {})
+                if failed:
+                    self._scorer_breaker.record_failure()
+                else:
+                    self._scorer_breaker.record_success()
+            finally:
+                # Restore original analyzer type if it was overridden
+                if original_analyzer_type is not None:
+                    scorer.analyzer_type = original_analyzer_type
+                self._release_persona_scorer(scorer)
+
+            if not failed:
+                self._cache_analysis(fingerprint, analysis)
+            return analysis
 
         except Exception as e:
-            logger.error(f"AI analysis failed: {str(e)}", exc_info=True)
+            self._scorer_breaker.record_failure()
+            logger.error("AI analysis failed: %s", e, exc_info=True)
             return {
                 "error": str(e),
                 "ai_analysis": {
@@ -427,6 +1223,96 @@ class RedditPersonaValidator:
                 }
             }
 
+    @staticmethod
+    def _analysis_fingerprint(account_info: Dict[str, Any],
+                              analysis_options: Dict[str, Any],
+                              analyzer_type: Optional[str]) -> str:
+        """Stable digest of everything an AI analysis depends on."""
+        payload = json.dumps(
+            {"account": account_info, "options": analysis_options, "analyzer": analyzer_type},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _get_cached_analysis(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached analysis from memory, then disk, if any."""
+        with self._cache_lock:
+            analysis = self._analysis_cache.get(fingerprint)
+            if analysis is not None:
+                self._analysis_cache.move_to_end(fingerprint)
+                return copy.deepcopy(analysis)
+
+        analysis = self._load_analysis_from_disk(fingerprint)
+        if analysis is not None:
+            self._remember_analysis(fingerprint, analysis)
+        return analysis
+
+    def _cache_analysis(self, fingerprint: str, analysis: Dict[str, Any]) -> None:
+        """Store an analysis in memory and on disk."""
+        self._remember_analysis(fingerprint, analysis)
+        self._save_analysis_to_disk(fingerprint, analysis)
+
+    def _remember_analysis(self, fingerprint: str, analysis: Dict[str, Any]) -> None:
+        """Store a copy of an analysis in memory, evicting the least recently used entries."""
+        if self.analysis_cache_size <= 0:
+            return
+
+        with self._cache_lock:
+            self._analysis_cache[fingerprint] = copy.deepcopy(analysis)
+            self._analysis_cache.move_to_end(fingerprint)
+            while len(self._analysis_cache) > self.analysis_cache_size:
+                self._analysis_cache.popitem(last=False)
+
+    def _load_analysis_from_disk(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Load an analysis from the disk cache if present and not expired."""
+        if self.analysis_cache_dir is None:
+            return None
+
+        cache_path = self.analysis_cache_dir / f"{fingerprint}.json"
+        try:
+            if time.time() - cache_path.stat().st_mtime >= self.analysis_cache_expiry:
+                return None
+            with open(cache_path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to load cached analysis %s: %s", fingerprint, e)
+            return None
+
+    def _save_analysis_to_disk(self, fingerprint: str, analysis: Dict[str, Any]) -> None:
+        """Write an analysis to the disk cache; written to a temp file first so readers never see a partial file."""
+        if self.analysis_cache_dir is None:
+            return
+
+        cache_path = self.analysis_cache_dir / f"{fingerprint}.json"
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+        try:
+            self.analysis_cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(analysis, f, default=str)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Failed to cache analysis %s: %s", fingerprint, e)
+
+    def _fails_early_reject(self, account_info: Dict[str, Any]) -> bool:
+        """
+        Check the opt-in ``scoring.early_reject`` gate.
+
+        Args:
+            account_info: Account information from _extract_account_info
+
+        Returns:
+            True if the gate is enabled and both karma and account age fall below it
+        """
+        gate = self.config.get("scoring", {}).get("early_reject", {})
+        if not gate.get("enabled", False):
+            return False
+
+        return (account_info.get("karma", 0) < gate.get("min_karma", 10) and
+                account_info.get("age_days", 0) < gate.get("min_account_age_days", 7))
+
     def _calculate_trust_score(self,
                               account_info: Dict[str, Any],
                               email_verified: Optional[bool] = None,
@@ -444,13 +1330,6 @@ class RedditPersonaValidator:
         Returns:
             Trust score between 0 and 100
         """
-        # Load scoring weights from config
-        scoring_config = self.config.get("scoring", {})
-        email_weight = scoring_config.get("email_verification_weight", 0.3)
-        age_weight = scoring_config.get("account_age_weight", 0.2)
-        karma_weight = scoring_config.get("karma_weight", 0.2)
-        ai_weight = scoring_config.get("ai_analysis_weight", 0.3)
-
         # Calculate base scores
         email_score = 100 if email_verified else 0
 
@@ -486,16 +1365,14 @@ class RedditPersonaValidator:
         if ai_score is not None or ai_analysis:
             # Include AI component in weighted score
             final_score = (
-                email_score * email_weight +
-                age_score * age_weight +
-                karma_score * karma_weight +
-                ai_component_score * ai_weight
+                email_score * self._email_weight +
+                age_score * self._age_weight +
+                karma_score * self._karma_weight +
+                ai_component_score * self._ai_weight
             )
         else:
-            # No AI analysis, adjust weights
-            adjusted_email_weight = email_weight / (email_weight + age_weight + karma_weight)
-            adjusted_age_weight = age_weight / (email_weight + age_weight + karma_weight)
-            adjusted_karma_weight = karma_weight / (email_weight + age_weight + karma_weight)
+            # No AI analysis, use the renormalized weights
+            adjusted_email_weight, adjusted_age_weight, adjusted_karma_weight = self._base_weights
 
             final_score = (
                 email_score * adjusted_email_weight +
@@ -505,14 +1382,27 @@ class RedditPersonaValidator:
 
         return round(final_score, 1)
 
-    def _cleanup(self) -> None:
-        """Clean up resources after validation."""
-        try:
-            if self.browser_engine:
-                self.browser_engine.close()
+    def close(self) -> None:
+        """Close all browser sessions and idle email connections."""
+        with self._stage_executor_lock:
+            executor, self._stage_executor = self._stage_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._browsers_lock:
+            engines = list(self._browser_engines)
+            self._browser_engines.clear()
+            self._idle_browsers.clear()
+        _close_browser_engines(engines)
+        self._http.close()
+        self._cleanup()
 
-            if self.email_verifier and hasattr(self.email_verifier, 'is_connected') and self.email_verifier.is_connected:
-                self.email_verifier.disconnect()
-
-        except Exception as e:
-            logger.warning(f"Cleanup error: {str(e)}")
+    def _cleanup(self) -> None:
+        """Clean up resources after validation; browsers stay warm until close()."""
+        with self._clients_lock:
+            verifiers = list(self._idle_email_verifiers)
+        for verifier in verifiers:
+            try:
+                if hasattr(verifier, 'is_connected') and verifier.is_connected:
+                    verifier.disconnect()
+            except Exception as e:
+                logger.warning("Cleanup error: %s", e)
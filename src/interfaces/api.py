@@ -240,9 +240,8 @@ async def validate_account_async(validator: RedditPersonaValidator, request: Val
     request_id = str(uuid.uuid4())
 
     try:
-        # Run the validation in a thread pool
-        result = await asyncio.to_thread(
-            validator.validate,
+        # Blocking stages run in worker threads inside validate_async
+        result = await validator.validate_async(
             username=request.username,
             email_address=request.email,
             perform_email_verification=request.verify_email,
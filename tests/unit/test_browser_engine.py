@@ -6,6 +6,8 @@ import time
 import json
 from pathlib import Path
 
+from selenium.common.exceptions import WebDriverException
+
 from src.core.browser_engine import BrowserEngine
 from src.utils.proxy_rotator import ProxyRotator
 
@@ -259,7 +261,7 @@ class TestBrowserEngine(unittest.TestCase):
             # Set up the difference between now and cake_day
             mock_diff = MagicMock()
             mock_diff.days = 365
-            mock_now - mock_cake_day = mock_diff
+            mock_now.__sub__.return_value = mock_diff
             
             # Test the calculation
             age_days = engine._calculate_account_age_days("May 5, 2018")
@@ -269,5 +271,99 @@ class TestBrowserEngine(unittest.TestCase):
             mock_datetime.strptime.assert_called_with("May 5, 2018", "%b %d, %Y")
 
 
+class TestBrowserEngineBatch(unittest.TestCase):
+    """Test cases for extract_account_info_batch against a fake CDP driver."""
+    
+    def setUp(self):
+        """Set up a driver whose tabs are tracked by target id."""
+        self.engine = BrowserEngine({"user_agent": "TestUserAgent/1.0", "max_tabs": 5})
+        self.driver = MagicMock()
+        self.driver.current_window_handle = "main"
+        self.engine.driver = self.driver
+        
+        self.current = "main"
+        self.cdp_calls = []  # (window, command, params)
+        self.failing_urls = set()
+        self.opened = 0
+        
+        def switch(handle):
+            self.current = handle
+        
+        def execute_cdp_cmd(command, params):
+            self.cdp_calls.append((self.current, command, params))
+            if command == "Target.createTarget":
+                self.opened += 1
+                return {"targetId": f"tab{self.opened}"}
+            if command == "Page.navigate" and params["url"] in self.failing_urls:
+                raise WebDriverException("net::ERR_CONNECTION_RESET")
+            return {}
+        
+        def execute_script(script, *args):
+            if "readyState" in script:
+                return "complete"
+            return True if "querySelector" in script else False
+        
+        self.driver.switch_to.window.side_effect = switch
+        self.driver.execute_cdp_cmd.side_effect = execute_cdp_cmd
+        self.driver.execute_script.side_effect = execute_script
+        self.driver.find_elements.return_value = []
+    
+    def _commands(self, window):
+        return [command for handle, command, _ in self.cdp_calls if handle == window]
+    
+    def test_new_tabs_get_stealth_before_navigating(self):
+        """Every tab registers the fingerprint patches before loading its page."""
+        results = self.engine.extract_account_info_batch(["alice", "bob"])
+        
+        self.assertTrue(results["alice"]["exists"])
+        self.assertTrue(results["bob"]["exists"])
+        tabs = [handle for handle, command, _ in self.cdp_calls if command == "Page.navigate"]
+        self.assertEqual(len(tabs), 4)
+        for tab in tabs:
+            commands = self._commands(tab)
+            self.assertLess(commands.index("Page.addScriptToEvaluateOnNewDocument"),
+                            commands.index("Page.navigate"))
+            self.assertLess(commands.index("Network.setUserAgentOverride"),
+                            commands.index("Page.navigate"))
+        
+        # Tabs start blank so nothing loads before the patches are in place
+        for _, command, params in self.cdp_calls:
+            if command == "Target.createTarget":
+                self.assertEqual(params["url"], "about:blank")
+    
+    def test_failed_load_returns_error(self):
+        """A tab that fails to load yields an error record, never a default account."""
+        self.failing_urls.add("https://www.reddit.com/user/bob")
+        
+        results = self.engine.extract_account_info_batch(["alice", "bob"])
+        
+        self.assertTrue(results["alice"]["exists"])
+        self.assertNotIn("error", results["alice"])
+        self.assertFalse(results["bob"]["exists"])
+        self.assertIn("ERR_CONNECTION_RESET", results["bob"]["error"])
+        
+        # Only the successful profile is cached
+        self.assertIsNotNone(self.engine._get_cached_profile("alice"))
+        self.assertIsNone(self.engine._get_cached_profile("bob"))
+        
+        # Every opened tab was closed and the original window restored
+        closed = {params["targetId"] for _, command, params in self.cdp_calls
+                  if command == "Target.closeTarget"}
+        self.assertEqual(closed, {f"tab{n}" for n in range(1, self.opened + 1)})
+        self.assertEqual(self.current, "main")
+    
+    def test_unreadable_tab_returns_error(self):
+        """A tab whose document never becomes readable yields an error record."""
+        self.engine.timeouts["page_load"] = 0.1
+        self.driver.execute_script.side_effect = lambda script, *args: (
+            "loading" if self.current == "tab1" else True)
+        
+        results = self.engine.extract_account_info_batch(["alice"])
+        
+        self.assertFalse(results["alice"]["exists"])
+        self.assertIn("error", results["alice"])
+        self.assertIsNone(self.engine._get_cached_profile("alice"))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,165 +1,368 @@
 """Unit tests for the email verifier module."""
 
+import imaplib
+import socket
 import unittest
-from unittest.mock import patch, MagicMock, PropertyMock
-import time
-from datetime import datetime
-import email
+from unittest.mock import patch, MagicMock
+from email import policy
+from email.parser import BytesHeaderParser
 
-from src.core.email_verifier import EmailVerifier
+from src.core import email_verifier as email_verifier_module
+from src.core.email_verifier import EmailVerifier, VerificationResult
+
+
+class FakeMailbox:
+    """Server-side state shared by every FakeIMAP connection."""
+
+    def __init__(self):
+        self.search_response = ('OK', [b''])
+        self.username_search_response = None  # Defaults to search_response
+        self.subjects = {}  # {uid: subject}
+        self.uid_next = 10
+        self.capabilities = ('IMAP4REV1',)
+        self.failures = {}  # {command: [exception, ...]}, raised once each
+        self.connections = []
+
+    def fail_next(self, command, error):
+        self.failures.setdefault(command, []).append(error)
+
+    def raise_scripted(self, command):
+        errors = self.failures.get(command)
+        if errors:
+            raise errors.pop(0)
+
+
+class FakeIMAP:
+    """Scripted stand-in for imaplib.IMAP4_SSL."""
+
+    def __init__(self, mailbox, host=None, port=None, ssl_context=None, timeout=None):
+        self.mailbox = mailbox
+        self.host, self.port = host, port
+        self.sock = MagicMock()
+        self.file = None
+        self.peer = None  # Server end of a real socket pair, see use_socketpair
+        self.untagged_responses = {}
+        self.capabilities = mailbox.capabilities
+        self.state = 'NONAUTH'
+        self.commands = []
+        self.completed = []
+        self.password = None
+        self.logged_out = False
+        self._tags = 0
+        self._last_tag = None
+        mailbox.connections.append(self)
+
+    def use_socketpair(self):
+        self.sock, self.peer = socket.socketpair()
+        self.file = self.sock.makefile('rb')
+
+    def readline(self):
+        line = self.file.readline()
+        if not line:
+            raise imaplib.IMAP4.abort('socket error: EOF')
+        return line
+
+    def login(self, user, password):
+        self.password = password
+        self.state = 'AUTH'
+        return 'OK', [b'LOGIN completed']
+
+    def select(self, folder):
+        self.commands.append(('SELECT', folder))
+        self.state = 'SELECTED'
+        return 'OK', [b'1']
+
+    def noop(self):
+        return 'OK', [b'NOOP completed']
+
+    def close(self):
+        self.state = 'AUTH'
+
+    def logout(self):
+        self.logged_out = True
+        if self.peer is not None:
+            self.sock.close()
+            self.peer.close()
+        return 'BYE', [b'Logging out']
+
+    def uid(self, command, *args):
+        self.commands.append((command,) + args)
+        self.mailbox.raise_scripted(command)
+        if command == 'SEARCH':
+            if 'OR SUBJECT' in args[1] and self.mailbox.username_search_response:
+                return self.mailbox.username_search_response
+            return self.mailbox.search_response
+        if command == 'FETCH':
+            data = []
+            for uid in args[0].split(b','):
+                header = b'Subject: ' + self.mailbox.subjects.get(uid, '').encode() + b'\r\n\r\n'
+                data.append((b'1 (UID ' + uid + b' BODY[HEADER.FIELDS (SUBJECT)] {%d}' % len(header), header))
+                data.append(b')')
+            return 'OK', data
+        raise AssertionError(f"Unexpected UID command {command}")
+
+    def _new_tag(self):
+        self._tags += 1
+        self._last_tag = b'A%03d' % self._tags
+        return self._last_tag
+
+    def _command(self, name, *args):
+        self.commands.append((name,) + args)
+        return self._new_tag()
+
+    def _command_complete(self, name, tag):
+        self.completed.append((name, tag))
+        return 'OK', [b'STATUS completed']
+
+    def _untagged_response(self, typ, data, name):
+        return typ, [b'INBOX (UIDNEXT %d)' % self.mailbox.uid_next]
+
+    def send(self, data):
+        self.commands.append(('SEND', data))
+        if data == b'DONE\r\n':
+            self.peer.sendall(self._last_tag + b' OK IDLE terminated\r\n')
 
 
 class TestEmailVerifier(unittest.TestCase):
-    """Test cases for the EmailVerifier class."""
-    
+    """Test cases for the EmailVerifier class against a fake IMAP server."""
+
     def setUp(self):
         """Set up test fixtures."""
         self.config = {
             "imap_server": "outlook.office365.com",
             "imap_port": 993,
+            "email_user": "test@outlook.com",
+            "email_pass": "password123",
             "connection_timeout": 5,
-            "verification_timeout": 10
+            "verification_timeout": 10,
+            "max_retries": 1
         }
-        
-        # Patch imaplib
-        self.imaplib_patcher = patch('src.core.email_verifier.imaplib')
-        self.mock_imaplib = self.imaplib_patcher.start()
-        
-        # Mock IMAP4_SSL instance
-        self.mock_imap = MagicMock()
-        self.mock_imaplib.IMAP4_SSL.return_value = self.mock_imap
-        
-        # Configure mock IMAP responses
-        self.mock_imap.login.return_value = ('OK', [b'Login successful'])
-        self.mock_imap.select.return_value = ('OK', [b'1'])
-    
+
+        self.mailbox = FakeMailbox()
+        self.imap_patcher = patch(
+            'src.core.email_verifier.imaplib.IMAP4_SSL',
+            side_effect=lambda *args, **kwargs: FakeIMAP(self.mailbox, *args, **kwargs)
+        )
+        self.mock_imap_ssl = self.imap_patcher.start()
+
+        # Retry backoff
+        self.sleep_patcher = patch('src.core.email_verifier.time.sleep')
+        self.sleep_patcher.start()
+
+        email_verifier_module._pool.close_all()
+
     def tearDown(self):
         """Tear down test fixtures."""
-        self.imaplib_patcher.stop()
-    
+        email_verifier_module._pool.close_all()
+        self.sleep_patcher.stop()
+        self.imap_patcher.stop()
+
+    def _connected_verifier(self, **overrides):
+        verifier = EmailVerifier({**self.config, **overrides})
+        self.assertTrue(verifier.connect())
+        return verifier
+
     def test_connect(self):
         """Test connecting to the email server."""
-        verifier = EmailVerifier(self.config)
-        
-        # Test successful connection
-        result = verifier.connect("test@outlook.com", "password123")
-        
-        # Verify connection was established
-        self.assertTrue(result)
+        verifier = self._connected_verifier()
+
         self.assertTrue(verifier.is_connected)
-        
-        # Verify IMAP methods were called
-        self.mock_imaplib.IMAP4_SSL.assert_called_once_with(
-            "outlook.office365.com", 993, timeout=5
-        )
-        self.mock_imap.login.assert_called_once_with("test@outlook.com", "password123")
-        self.mock_imap.select.assert_called_once_with('INBOX')
-    
+        self.mock_imap_ssl.assert_called_once()
+        args, kwargs = self.mock_imap_ssl.call_args
+        self.assertEqual(args, ("outlook.office365.com", 993))
+        self.assertEqual(kwargs["timeout"], 5)
+
+        conn = self.mailbox.connections[0]
+        self.assertEqual(conn.password, "password123")
+        self.assertIn(('SELECT', 'INBOX'), conn.commands)
+
     def test_connect_failure(self):
         """Test connection failure handling."""
         verifier = EmailVerifier(self.config)
-        
-        # Test login failure
-        self.mock_imap.login.return_value = ('NO', [b'Login failed'])
-        
-        result = verifier.connect("test@outlook.com", "wrong_password")
-        
-        self.assertFalse(result)
+
+        with patch.object(FakeIMAP, 'login', side_effect=imaplib.IMAP4.error("Login failed")):
+            with self.assertRaises(imaplib.IMAP4.error):
+                verifier.connect()
+
         self.assertFalse(verifier.is_connected)
-    
-    def test_disconnect(self):
-        """Test disconnecting from the email server."""
-        verifier = EmailVerifier(self.config)
-        verifier.imap = self.mock_imap
-        verifier.is_connected = True
-        
+
+    def test_disconnect_returns_connection_to_pool(self):
+        """Test a healthy connection is pooled and reused by the next verifier."""
+        verifier = self._connected_verifier()
+        conn = verifier.imap
+
         verifier.disconnect()
-        
-        # Verify IMAP methods were called
-        self.mock_imap.close.assert_called_once()
-        self.mock_imap.logout.assert_called_once()
-        
-        # Verify attributes were reset
+
         self.assertIsNone(verifier.imap)
         self.assertFalse(verifier.is_connected)
-    
+        self.assertFalse(conn.logged_out)
+
+        second = self._connected_verifier()
+        self.assertIs(second.imap, conn)
+        self.mock_imap_ssl.assert_called_once()
+
+    def test_pool_requires_matching_password(self):
+        """Test a verifier with another password never gets a pooled session."""
+        self._connected_verifier().disconnect()
+        pooled = self.mailbox.connections[0]
+
+        intruder = self._connected_verifier(email_pass="wrong")
+
+        self.assertIsNot(intruder.imap, pooled)
+        self.assertEqual(intruder.imap.password, "wrong")
+        self.assertEqual(self.mock_imap_ssl.call_count, 2)
+
+        # The original session is still waiting for its owner
+        owner = self._connected_verifier()
+        self.assertIs(owner.imap, pooled)
+
     def test_context_manager(self):
         """Test that context manager properly connects and disconnects."""
         with patch.object(EmailVerifier, 'connect') as mock_connect:
             with patch.object(EmailVerifier, 'disconnect') as mock_disconnect:
                 with EmailVerifier(self.config) as verifier:
                     mock_connect.assert_called_once()
-                
+
                 mock_disconnect.assert_called_once()
-    
+
     def test_search_verification_emails(self):
-        """Test searching for verification emails."""
-        verifier = EmailVerifier(self.config)
-        verifier.imap = self.mock_imap
-        verifier.is_connected = True
-        
-        # Mock search results
-        self.mock_imap.search.return_value = ('OK', [b'1 2 3'])
-        
-        # Mock fetch for username filtering
-        mock_email = MagicMock()
-        mock_email.get_payload.return_value = "This is an email for u/testuser"
-        
-        with patch.object(verifier, '_fetch_email') as mock_fetch:
-            with patch.object(verifier, '_get_email_body') as mock_get_body:
-                mock_fetch.return_value = {"message": mock_email}
-                mock_get_body.return_value = "This is an email for u/testuser"
-                
-                # Test search without username
-                email_ids = verifier._search_verification_emails(days=30)
-                
-                # Verify correct search criteria were used
-                self.mock_imap.search.assert_called_with(
-                    None, 
-                    '(SINCE "26-May-2025") (FROM "reddit.com") (SUBJECT "Reddit account verification")'
-                )
-                self.assertEqual(email_ids, [b'1', b'2', b'3'])
-                
-                # Test search with username
-                email_ids = verifier._search_verification_emails(username="testuser", days=30)
-                
-                # Verify emails were filtered by username
-                self.assertEqual(len(email_ids), 3)
-    
+        """Test searching for verification emails, newest first."""
+        verifier = self._connected_verifier()
+        self.mailbox.search_response = ('OK', [b'1 2 3'])
+
+        email_ids = list(verifier._search_verification_emails(username="testuser", days=30))
+
+        self.assertEqual(email_ids, [b'3', b'2', b'1'])
+        _, _, criteria = verifier.imap.commands[-1]
+        self.assertIn('(FROM "reddit.com")', criteria)
+        self.assertIn('(OR SUBJECT "testuser" BODY "testuser")', criteria)
+
+    def test_search_drops_uids_below_min_uid(self):
+        """Test UID n:* matches below n are dropped."""
+        verifier = self._connected_verifier()
+        self.mailbox.search_response = ('OK', [b'7'])
+
+        email_ids = list(verifier._search_verification_emails(min_uid=10))
+
+        self.assertEqual(email_ids, [])
+        self.assertIn('(UID 10:*)', verifier.imap.commands[-1][2])
+
+    def test_filter_by_subject_retries_abort(self):
+        """Test an abort during the lazy subject FETCH reconnects and retries."""
+        verifier = self._connected_verifier()
+        self.mailbox.username_search_response = ('NO', [b'BODY search not supported'])
+        self.mailbox.search_response = ('OK', [b'1 2 3'])
+        self.mailbox.subjects = {
+            b'1': "Verify u/someone_else",
+            b'2': "Verify your account testuser",
+            b'3': "Verify your account TestUser"
+        }
+        self.mailbox.fail_next('FETCH', imaplib.IMAP4.abort("connection reset"))
+
+        email_ids = verifier._search_verification_emails(username="testuser")
+
+        self.assertEqual(list(email_ids), [b'3', b'2'])
+        self.assertEqual(len(self.mailbox.connections), 2)
+        self.assertTrue(self.mailbox.connections[0].logged_out)
+        self.assertIs(verifier.imap, self.mailbox.connections[1])
+
+    def test_uid_next_reissued_after_reconnect(self):
+        """Test a pipelined STATUS is re-sent when the SEARCH reconnects."""
+        verifier = self._connected_verifier()
+        first = verifier.imap
+        request = verifier._request_uid_next()
+        self.mailbox.fail_next('SEARCH', imaplib.IMAP4.abort("connection reset"))
+
+        list(verifier._search_verification_emails(username="testuser", days=30))
+        self.mailbox.uid_next = 42
+        uid_next = verifier._uid_next(request)
+
+        self.assertEqual(uid_next, 42)
+        self.assertEqual(first.completed, [])
+        second = verifier.imap
+        self.assertIsNot(second, first)
+        self.assertIn(('STATUS', 'INBOX', '(UIDNEXT)'), second.commands)
+        self.assertEqual(len(second.completed), 1)
+
+    def test_uid_next_pipelined(self):
+        """Test STATUS is collected on the connection it was sent on."""
+        verifier = self._connected_verifier()
+        request = verifier._request_uid_next()
+
+        self.assertEqual(verifier._uid_next(request), 10)
+        self.assertEqual(verifier.imap.completed, [('STATUS', request[1])])
+
+    def test_idle_wait_new_mail(self):
+        """Test IDLE returns True when the server pushes EXISTS."""
+        verifier = self._connected_verifier()
+        verifier.imap.use_socketpair()
+        verifier.imap.peer.sendall(b'+ idling\r\n* 4 EXISTS\r\n')
+
+        self.assertTrue(verifier._idle_wait(5))
+        self.assertIn(('SEND', b'DONE\r\n'), verifier.imap.commands)
+
+    def test_idle_wait_timeout(self):
+        """Test IDLE ends with DONE and returns False when nothing arrives."""
+        verifier = self._connected_verifier()
+        verifier.imap.use_socketpair()
+        verifier.imap.peer.sendall(b'+ idling\r\n')
+
+        self.assertFalse(verifier._idle_wait(0.05))
+        self.assertIn(('SEND', b'DONE\r\n'), verifier.imap.commands)
+
+        # The session is still readable after the timed-out read
+        verifier.imap.peer.sendall(b'+ idling\r\n* 5 EXISTS\r\n')
+        self.assertTrue(verifier._idle_wait(5))
+
+    def test_idle_wait_collected_exists(self):
+        """Test an EXISTS imaplib already collected skips IDLE."""
+        verifier = self._connected_verifier()
+        verifier.imap.use_socketpair()
+        verifier.imap.untagged_responses['EXISTS'] = [b'4']
+
+        self.assertTrue(verifier._idle_wait(5))
+        self.assertNotIn('EXISTS', verifier.imap.untagged_responses)
+        self.assertFalse(any(command[0] == 'SEND' for command in verifier.imap.commands))
+
+    def test_idle_rejected(self):
+        """Test a server refusing IDLE raises instead of hanging."""
+        verifier = self._connected_verifier()
+        verifier.imap.use_socketpair()
+        verifier.imap.peer.sendall(b'A001 BAD unknown command\r\n')
+
+        with self.assertRaises(imaplib.IMAP4.error):
+            verifier._idle_wait(5)
+
     def test_process_verification_email(self):
-        """Test processing a verification email."""
-        verifier = EmailVerifier(self.config)
-        verifier.imap = self.mock_imap
-        verifier.is_connected = True
-        
-        # Create a mock email message
-        mock_email_message = email.message.Message()
-        mock_email_message["Subject"] = "Reddit account verification"
-        mock_email_message["Date"] = "Thu, 26 Jun 2025 12:00:00 -0400"
-        mock_email_message["Message-ID"] = "<message123@reddit.com>"
-        mock_email_message.set_payload("u/testuser - Verify your Reddit account at https://www.reddit.com/verification/abc123")
-        
-        with patch.object(verifier, '_fetch_email') as mock_fetch:
-            with patch.object(verifier, '_get_email_body') as mock_get_body:
-                mock_fetch.return_value = {"id": b'1', "message": mock_email_message}
-                mock_get_body.return_value = "u/testuser - Verify your Reddit account at https://www.reddit.com/verification/abc123"
-                
-                # Process the email
-                verification_data = verifier._process_verification_email(b'1')
-                
-                # Verify correct data was extracted
-                self.assertEqual(verification_data["username"], "testuser")
-                self.assertEqual(verification_data["verification_link"], "https://www.reddit.com/verification/abc123")
-                self.assertIsNotNone(verification_data["timestamp"])
-                self.assertEqual(verification_data["message_id"], "message123@reddit.com")
-    
+        """Test processing a verification email, parsed once per UID."""
+        verifier = self._connected_verifier()
+        message = BytesHeaderParser(policy=policy.default).parsebytes(
+            b"Subject: Reddit account verification\r\n"
+            b"Date: Thu, 26 Jun 2025 12:00:00 -0400\r\n"
+            b"Message-ID: <message123@reddit.com>\r\n\r\n"
+        )
+        fetched = {
+            "id": b'1',
+            "message": message,
+            "payload": b"u/testuser is your username. Verify at https://www.reddit.com/verification/abc123",
+            "charset": "utf-8",
+            "received": None
+        }
+
+        with patch.object(verifier, '_fetch_email', return_value=fetched) as mock_fetch:
+            verification_data = verifier._process_verification_email(b'1')
+            again = verifier._process_verification_email(b'1')
+
+        self.assertEqual(verification_data["username"], "testuser")
+        self.assertEqual(verification_data["verification_link"], "https://www.reddit.com/verification/abc123")
+        self.assertEqual(verification_data["timestamp"], "2025-06-26T12:00:00-04:00")
+        self.assertEqual(verification_data["message_id"], "message123@reddit.com")
+        self.assertEqual(again, verification_data)
+        mock_fetch.assert_called_once()
+
     def test_verify_reddit_account_existing(self):
         """Test verifying a Reddit account with existing verification."""
-        verifier = EmailVerifier(self.config)
-        verifier.imap = self.mock_imap
-        verifier.is_connected = True
-        
-        # Mock verification data
+        verifier = self._connected_verifier()
         verification_data = {
             "username": "testuser",
             "verification_link": "https://www.reddit.com/verification/abc123",
@@ -167,113 +370,61 @@ class TestEmailVerifier(unittest.TestCase):
             "message_id": "message123@reddit.com",
             "subject": "Reddit account verification"
         }
-        
-        with patch.object(verifier, '_search_verification_emails') as mock_search:
-            with patch.object(verifier, '_process_verification_email') as mock_process:
-                mock_search.return_value = [b'1']
-                mock_process.return_value = verification_data
-                
-                # Test verification
+
+        with patch.object(verifier, '_search_verification_emails', return_value=iter([b'1'])):
+            with patch.object(verifier, '_process_verification_email', return_value=verification_data):
                 result = verifier.verify_reddit_account("testuser", "test@outlook.com")
-                
-                # Verify correct result
-                self.assertTrue(result["verified"])
-                self.assertEqual(result["reddit_username"], "testuser")
-                self.assertEqual(result["verification_time"], "2025-06-26T12:00:00-04:00")
-                self.assertEqual(result["verification_id"], "message123@reddit.com")
-    
+
+        self.assertIsInstance(result, VerificationResult)
+        self.assertTrue(result.verified)
+        self.assertEqual(result.reddit_username, "testuser")
+        self.assertEqual(result.verification_time, "2025-06-26T12:00:00-04:00")
+        self.assertEqual(result.verification_id, "message123@reddit.com")
+
     def test_verify_reddit_account_waiting(self):
-        """Test waiting for a new verification email."""
-        verifier = EmailVerifier(self.config)
-        verifier.imap = self.mock_imap
-        verifier.is_connected = True
-        
-        # Mock no existing verification, then new verification after wait
+        """Test waiting for a new verification email searches from UIDNEXT."""
+        verifier = self._connected_verifier()
         verification_data = {
             "username": "testuser",
-            "verification_link": "https://www.reddit.com/verification/abc123",
             "timestamp": "2025-06-26T12:00:00-04:00",
-            "message_id": "message123@reddit.com",
-            "subject": "Reddit account verification"
+            "message_id": "message123@reddit.com"
         }
-        
-        with patch.object(verifier, '_search_verification_emails') as mock_search:
-            with patch.object(verifier, '_process_verification_email') as mock_process:
-                with patch('src.core.email_verifier.time.sleep'):
-                    # No existing verification
-                    mock_search.side_effect = [[], [b'1']]
-                    mock_process.return_value = verification_data
-                    
-                    # Test verification with waiting
-                    result = verifier.verify_reddit_account("testuser", "test@outlook.com", wait_for_verification=True)
-                    
-                    # Verify correct result
-                    self.assertTrue(result["verified"])
-                    self.assertEqual(result["reddit_username"], "testuser")
-    
+
+        with patch.object(verifier, '_search_verification_emails',
+                          side_effect=[iter([]), iter([b'10'])]) as mock_search:
+            with patch.object(verifier, '_process_verification_email', return_value=verification_data):
+                result = verifier.verify_reddit_account("testuser", "test@outlook.com", wait_for_verification=True)
+
+        self.assertTrue(result.verified)
+        self.assertEqual(mock_search.call_args_list[1].kwargs, {"min_uid": 10})
+
     def test_verify_reddit_account_timeout(self):
         """Test verification timeout."""
-        verifier = EmailVerifier(self.config)
-        verifier.imap = self.mock_imap
-        verifier.is_connected = True
-        
-        with patch.object(verifier, '_search_verification_emails') as mock_search:
-            with patch('src.core.email_verifier.time.sleep'):
-                with patch('src.core.email_verifier.time.time') as mock_time:
-                    # No existing verification
-                    mock_search.return_value = []
-                    
-                    # Set up time to trigger timeout
-                    mock_time.side_effect = [0, 100, 200, 300, 400]
-                    
-                    # Test verification with timeout
-                    result = verifier.verify_reddit_account("testuser", "test@outlook.com", wait_for_verification=True)
-                    
-                    # Verify correct result
-                    self.assertFalse(result["verified"])
-                    self.assertEqual(result["error"], "Verification timeout")
-    
-    def test_test_connection(self):
-        """Test connection test functionality."""
-        verifier = EmailVerifier(self.config)
-        verifier.imap = self.mock_imap
-        verifier.is_connected = True
-        
-        # Mock successful NOOP
-        self.mock_imap.noop.return_value = ('OK', [b'NOOP completed'])
-        
-        # Test connection test
-        result = verifier.test_connection()
-        
-        # Verify result
-        self.assertTrue(result)
-        self.mock_imap.noop.assert_called_once()
-        
-        # Test failed connection
-        self.mock_imap.noop.return_value = ('NO', [b'Connection lost'])
-        result = verifier.test_connection()
-        self.assertFalse(result)
-    
-    def test_get_inbox_statistics(self):
-        """Test getting inbox statistics."""
-        verifier = EmailVerifier(self.config)
-        verifier.imap = self.mock_imap
-        verifier.is_connected = True
-        
-        # Mock status response
-        self.mock_imap.status.return_value = ('OK', [b'INBOX (MESSAGES 100 UNSEEN 10)'])
-        
-        with patch.object(verifier, '_search_verification_emails') as mock_search:
-            mock_search.return_value = [b'1', b'2', b'3']
-            
-            # Test getting statistics
-            stats = verifier.get_inbox_statistics()
-            
-            # Verify correct statistics
-            self.assertEqual(stats["total_messages"], 100)
-            self.assertEqual(stats["unread_messages"], 10)
-            self.assertEqual(stats["reddit_verification_emails"], 3)
+        verifier = self._connected_verifier(verification_timeout=0)
+
+        with patch.object(verifier, '_search_verification_emails', return_value=iter([])):
+            result = verifier.verify_reddit_account("testuser", "test@outlook.com", wait_for_verification=True)
+
+        self.assertFalse(result.verified)
+        self.assertEqual(result.error, "Verification timeout reached")
+
+
+    def test_failed_session_not_pooled(self):
+        """Test a session that timed out mid-command is logged out, not pooled."""
+        verifier = self._connected_verifier()
+        conn = verifier.imap
+        self.mailbox.fail_next('SEARCH', TimeoutError("timed out"))
+
+        with verifier:
+            result = verifier.verify_reddit_account("testuser", "test@outlook.com", wait_for_verification=False)
+
+        self.assertEqual(result.error, "Operation timed out")
+        self.assertTrue(conn.logged_out)
 
+        # The next verifier opens a fresh session
+        second = self._connected_verifier()
+        self.assertIsNot(second.imap, conn)
+        self.assertEqual(self.mock_imap_ssl.call_count, 2)
 
 if __name__ == '__main__':
     unittest.main()
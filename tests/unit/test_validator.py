@@ -1,15 +1,17 @@
 """Unit tests for the RedditPersonaValidator."""
 
+import asyncio
+import threading
 import unittest
-from unittest.mock import patch, Mock, MagicMock
+from unittest.mock import patch, Mock, MagicMock, AsyncMock
 import tempfile
 import os
 import yaml
 import json
 from pathlib import Path
 
-from src.core.validator import RedditPersonaValidator, ValidationResult
-from src.core.email_verifier import VerificationResult
+from src.core.validator import RedditPersonaValidator, ValidationResult, clear_proxy_rotators
+from src.core.email_verifier import VerificationResult, VERIFICATION_TIMEOUT
 from src.utils.proxy_rotator import ProxyRotator
 from src.core.browser_engine import BrowserEngine
 from src.analysis.scorer import PersonaScorer
@@ -20,6 +22,9 @@ class TestRedditPersonaValidator(unittest.TestCase):
     
     def setUp(self):
         """Set up test environment."""
+        # Validators share ProxyRotators per process; start each test without one
+        clear_proxy_rotators()
+        
         # Create a temporary config file
         self.temp_config_dir = tempfile.TemporaryDirectory()
         self.config_path = os.path.join(self.temp_config_dir.name, "config.yaml")
@@ -29,7 +34,8 @@ class TestRedditPersonaValidator(unittest.TestCase):
             "reddit": {
                 "user_agent": "TestValidator/1.0",
                 "request_timeout": 10,
-                "captcha_timeout": 10
+                "captcha_timeout": 10,
+                "json_fast_path": False
             },
             "email": {
                 "imap_server": "test.example.com",
@@ -109,9 +115,10 @@ class TestRedditPersonaValidator(unittest.TestCase):
     
     def tearDown(self):
         """Clean up after tests."""
+        clear_proxy_rotators()
         self.temp_config_dir.cleanup()
     
-    @patch('src.utils.proxy_rotator.ProxyRotator')
+    @patch('src.core.validator.ProxyRotator')
     def test_initialization(self, mock_proxy_rotator):
         """Test validator initialization and config loading."""
         validator = RedditPersonaValidator(config_path=self.config_path)
@@ -123,11 +130,24 @@ class TestRedditPersonaValidator(unittest.TestCase):
         # Verify proxy rotator initialized
         mock_proxy_rotator.assert_called_once()
         
-        # Verify lazy initialization (should be None until used)
-        self.assertIsNone(validator.browser_engine)
+        # Verify lazy initialization (nothing started until used)
+        self.assertEqual(validator._browser_engines, [])
         self.assertIsNone(validator.email_verifier)
         self.assertIsNone(validator.persona_scorer)
     
+    @patch('src.core.validator.ProxyRotator')
+    def test_proxy_rotator_shared(self, mock_proxy_rotator):
+        """Test validators with the same proxy config share one rotator until cleared."""
+        first = RedditPersonaValidator(config_path=self.config_path)
+        second = RedditPersonaValidator(config_path=self.config_path)
+        
+        self.assertIs(first.proxy_rotator, second.proxy_rotator)
+        mock_proxy_rotator.assert_called_once()
+        
+        clear_proxy_rotators()
+        RedditPersonaValidator(config_path=self.config_path)
+        self.assertEqual(mock_proxy_rotator.call_count, 2)
+    
     def test_load_invalid_config(self):
         """Test handling of invalid config file."""
         # Non-existent config file
@@ -185,6 +205,138 @@ class TestRedditPersonaValidator(unittest.TestCase):
         self.assertFalse(result["exists"])
         self.assertEqual(result["error"], "Browser error")
     
+    @patch('src.core.validator.BrowserEngine')
+    @patch('src.core.validator.requests.Session')
+    def test_extract_account_info_json_fast_path(self, mock_session, mock_browser):
+        """Test account info comes from about.json without starting a browser."""
+        self.test_config["reddit"]["json_fast_path"] = True
+        with open(self.config_path, 'w') as f:
+            yaml.dump(self.test_config, f)
+        
+        mock_get = mock_session.return_value.get
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {
+            "data": {
+                "name": "test_user",
+                "link_karma": 1000,
+                "comment_karma": 4000,
+                "total_karma": 5000,
+                "created_utc": 1000000000.0,
+                "has_verified_email": True,
+                "is_mod": False
+            }
+        }
+        
+        validator = RedditPersonaValidator(config_path=self.config_path)
+        result = validator._extract_account_info("test_user")
+        
+        self.assertTrue(result["exists"])
+        self.assertEqual(result["karma"], 5000)
+        self.assertEqual(result["comment_karma"], 4000)
+        self.assertTrue(result["verified_email"])
+        self.assertGreater(result["age_days"], 365)
+        mock_browser.assert_not_called()
+        
+        # Blocked or missing accounts fall back to the browser
+        mock_get.return_value.status_code = 429
+        mock_browser.return_value.extract_account_info_batch.side_effect = lambda names: {name: dict(self.valid_account_info) for name in names}
+        validator._extract_account_info("other_user")
+        mock_browser.return_value.extract_account_info_batch.assert_called_once_with(["other_user"])
+    
+    @patch('src.core.validator.BrowserEngine')
+    def test_extract_account_info_missing_cached(self, mock_browser):
+        """Test nonexistent accounts are remembered and not looked up again."""
+        mock_instance = mock_browser.return_value
+        # The browser reports a missing profile without an error
+        mock_instance.extract_account_info_batch.side_effect = lambda names: {name: {"username": name, "exists": False} for name in names}
+        
+        validator = RedditPersonaValidator(config_path=self.config_path)
+        validator._extract_account_info("nonexistent_user")
+        result = validator._extract_account_info("nonexistent_user")
+        
+        self.assertFalse(result["exists"])
+        mock_instance.extract_account_info_batch.assert_called_once_with(["nonexistent_user"])
+    
+    @patch('src.core.validator.BrowserEngine')
+    def test_extract_account_info_browser_error_not_missing(self, mock_browser):
+        """Test a failed profile load is not remembered as a missing account."""
+        mock_instance = mock_browser.return_value
+        mock_instance.extract_account_info_batch.side_effect = lambda names: {
+            name: {"username": name, "exists": False, "error": "Profile extraction failed: timeout"}
+            for name in names
+        }
+        
+        validator = RedditPersonaValidator(config_path=self.config_path)
+        result = validator._extract_account_info("test_user")
+        self.assertIn("Profile extraction failed", result["error"])
+        self.assertFalse(validator._is_known_missing("test_user"))
+        
+        # The next lookup goes back to the browser
+        validator._extract_account_info("test_user")
+        self.assertEqual(mock_instance.extract_account_info_batch.call_count, 2)
+    
+    @patch('src.core.validator.BrowserEngine')
+    def test_browser_breaker_half_open_start_failure(self, mock_browser):
+        """Test a browser that fails to start settles the half-open trial."""
+        self.test_config["circuit_breaker"] = {"failure_threshold": 1, "cooldown": 0}
+        with open(self.config_path, 'w') as f:
+            yaml.dump(self.test_config, f)
+        
+        failed = MagicMock()
+        failed.extract_account_info_batch.side_effect = Exception("chrome crashed")
+        mock_browser.side_effect = [failed, Exception("chromedriver failed to start"), Exception("still down")]
+        
+        validator = RedditPersonaValidator(config_path=self.config_path)
+        validator._extract_account_info("test_user")  # opens the breaker
+        
+        # The trial call fails to start Chrome and re-opens the breaker...
+        result = validator._extract_account_info("test_user")
+        self.assertIn("chromedriver failed to start", result["error"])
+        
+        # ...so after the cooldown another trial is let through
+        result = validator._extract_account_info("test_user")
+        self.assertIn("still down", result["error"])
+        self.assertEqual(mock_browser.call_count, 3)
+    
+    @patch('src.core.validator.BrowserEngine')
+    def test_extract_account_info_failure_not_cached(self, mock_browser):
+        """Test failed browser lookups leave both account caches empty."""
+        mock_instance = mock_browser.return_value
+        mock_instance.extract_account_info_batch.side_effect = Exception("chrome crashed")
+        
+        validator = RedditPersonaValidator(config_path=self.config_path)
+        result = validator._extract_account_info("test_user")
+        self.assertFalse(result["exists"])
+        self.assertIn("chrome crashed", result["error"])
+        
+        mock_instance.extract_account_info_batch.side_effect = lambda names: {
+            name: {"username": name, "exists": False, "error": "Profile extraction failed: timeout"}
+            for name in names
+        }
+        validator._extract_account_info("test_user")
+        
+        self.assertEqual(len(validator._account_cache), 0)
+        self.assertEqual(len(validator._missing_accounts), 0)
+        self.assertEqual(mock_instance.extract_account_info_batch.call_count, 2)
+    
+    @patch('src.core.validator.BrowserEngine')
+    def test_extract_account_info_cached(self, mock_browser):
+        """Test repeated extraction of the same account hits the cache."""
+        mock_instance = mock_browser.return_value
+        mock_instance.extract_account_info_batch.side_effect = lambda names: {name: dict(self.valid_account_info) for name in names}
+        
+        validator = RedditPersonaValidator(config_path=self.config_path)
+        first = validator._extract_account_info("test_user")
+        second = validator._extract_account_info("Test_User")
+        
+        self.assertEqual(first, second)
+        mock_instance.extract_account_info_batch.assert_called_once_with(["test_user"])
+        
+        # Clearing the cache forces a fresh lookup
+        validator.clear_cache()
+        validator._extract_account_info("test_user")
+        self.assertEqual(mock_instance.extract_account_info_batch.call_count, 2)
+    
     @patch('src.core.email_verifier.EmailVerifier')
     def test_verify_email_success(self, mock_email_verifier):
         """Test email verification when successful."""
@@ -232,6 +384,55 @@ class TestRedditPersonaValidator(unittest.TestCase):
         self.assertFalse(result.verified)
         self.assertEqual(result.error, "IMAP error")
     
+    @patch('src.core.validator.EmailVerifier')
+    def test_verify_email_circuit_breaker(self, mock_email_verifier):
+        """Test email verification fails fast after repeated failures."""
+        self.test_config["circuit_breaker"] = {"failure_threshold": 2, "cooldown": 60}
+        with open(self.config_path, 'w') as f:
+            yaml.dump(self.test_config, f)
+        
+        mock_instance = mock_email_verifier.return_value
+        mock_instance.__enter__.side_effect = Exception("IMAP connection refused")
+        
+        validator = RedditPersonaValidator(config_path=self.config_path)
+        for _ in range(2):
+            result = validator._verify_email("test_user", "user@example.com")
+            self.assertEqual(result.error, "IMAP connection refused")
+        
+        result = validator._verify_email("test_user", "user@example.com")
+        self.assertFalse(result.verified)
+        self.assertIn("unavailable", result.error)
+        self.assertEqual(mock_instance.__enter__.call_count, 2)
+    
+    @patch('src.core.validator.EmailVerifier')
+    def test_verify_email_breaker_opens_on_error_result(self, mock_email_verifier):
+        """Test error results from the verifier count as failures, but timeouts don't."""
+        self.test_config["circuit_breaker"] = {"failure_threshold": 2, "cooldown": 60}
+        with open(self.config_path, 'w') as f:
+            yaml.dump(self.test_config, f)
+        
+        mock_instance = mock_email_verifier.return_value
+        mock_instance.__enter__.return_value = mock_instance
+        mock_instance.verify_reddit_account.return_value = VerificationResult(
+            verified=False, email="user@example.com", reddit_username="test_user",
+            error=VERIFICATION_TIMEOUT
+        )
+        
+        validator = RedditPersonaValidator(config_path=self.config_path)
+        for _ in range(3):
+            result = validator._verify_email("test_user", "user@example.com")
+            self.assertEqual(result.error, VERIFICATION_TIMEOUT)
+        
+        mock_instance.verify_reddit_account.return_value = VerificationResult(
+            verified=False, email="user@example.com", reddit_username="test_user",
+            error="Connection failed"
+        )
+        for _ in range(2):
+            validator._verify_email("test_user", "user@example.com")
+        result = validator._verify_email("test_user", "user@example.com")
+        self.assertIn("unavailable", result.error)
+        self.assertEqual(mock_instance.verify_reddit_account.call_count, 5)
+    
     @patch('src.analysis.scorer.PersonaScorer')
     def test_analyze_persona_success(self, mock_scorer):
         """Test AI analysis when successful."""
@@ -247,6 +448,40 @@ class TestRedditPersonaValidator(unittest.TestCase):
         # Verify scorer was called with correct account info
         mock_instance.calculate_trust_score.assert_called_once_with(self.valid_account_info)
     
+    @patch('src.core.validator.PersonaScorer')
+    def test_analyze_persona_cached(self, mock_scorer):
+        """Test repeated analysis of identical account info reuses the result."""
+        mock_instance = mock_scorer.return_value
+        mock_instance.calculate_trust_score_with_options.return_value = self.ai_analysis_result
+        
+        validator = RedditPersonaValidator(config_path=self.config_path)
+        first = validator._analyze_persona(self.valid_account_info)
+        second = validator._analyze_persona(dict(self.valid_account_info))
+        
+        self.assertEqual(first, second)
+        mock_instance.calculate_trust_score_with_options.assert_called_once()
+    
+    @patch('src.core.validator.PersonaScorer')
+    def test_analyze_persona_breaker_opens_on_error_result(self, mock_scorer):
+        """Test LLM failures reported as error results open the scorer breaker."""
+        self.test_config["circuit_breaker"] = {"failure_threshold": 2, "cooldown": 60}
+        with open(self.config_path, 'w') as f:
+            yaml.dump(self.test_config, f)
+        
+        mock_instance = mock_scorer.return_value
+        mock_instance.calculate_trust_score_with_options.return_value = {
+            "ai_analysis": {"error": "LLM backend unavailable", "viability_score": 0}
+        }
+        
+        validator = RedditPersonaValidator(config_path=self.config_path)
+        for _ in range(2):
+            result = validator._analyze_persona(self.valid_account_info)
+            self.assertEqual(result["ai_analysis"]["error"], "LLM backend unavailable")
+        
+        result = validator._analyze_persona(self.valid_account_info)
+        self.assertIn("unavailable after repeated failures", result["error"])
+        self.assertEqual(mock_instance.calculate_trust_score_with_options.call_count, 2)
+    
     @patch('src.analysis.scorer.PersonaScorer')
     def test_analyze_persona_exception(self, mock_scorer):
         """Test AI analysis when an exception occurs."""
@@ -327,6 +562,95 @@ class TestRedditPersonaValidator(unittest.TestCase):
         mock_score.assert_called_once()
         mock_cleanup.assert_called_once()
     
+    @patch('src.core.validator.RedditPersonaValidator._extract_account_info')
+    @patch('src.core.validator.RedditPersonaValidator._verify_email')
+    @patch('src.core.validator.RedditPersonaValidator._analyze_persona')
+    def test_validate_after_close(self, mock_analyze, mock_verify, mock_extract):
+        """Test validate() runs both stages again after close()."""
+        mock_extract.return_value = self.valid_account_info
+        mock_verify.return_value = self.email_verification_success
+        mock_analyze.return_value = self.ai_analysis_result
+        
+        validator = RedditPersonaValidator(config_path=self.config_path)
+        for _ in range(2):
+            result = validator.validate(
+                username="test_user",
+                email_address="user@example.com",
+                perform_email_verification=True
+            )
+            self.assertTrue(result.email_verified)
+            self.assertEqual(result.errors, [])
+            validator.close()
+        
+        self.assertEqual(mock_verify.call_count, 2)
+    
+    @patch('src.core.validator.RedditPersonaValidator._extract_account_info')
+    @patch('src.core.validator.RedditPersonaValidator._verify_email_async', new_callable=AsyncMock)
+    @patch('src.core.validator.RedditPersonaValidator._verify_email')
+    @patch('src.core.validator.RedditPersonaValidator._analyze_persona')
+    def test_validate_inside_event_loop(self, mock_analyze, mock_verify, mock_verify_async, mock_extract):
+        """Test validate() stays synchronous and works under a running loop."""
+        mock_extract.return_value = self.valid_account_info
+        mock_verify.return_value = self.email_verification_success
+        mock_verify_async.return_value = self.email_verification_success
+        mock_analyze.return_value = self.ai_analysis_result
+        
+        validator = RedditPersonaValidator(config_path=self.config_path)
+        
+        async def caller():
+            return validator.validate(
+                username="test_user",
+                email_address="user@example.com",
+                perform_email_verification=True
+            )
+        
+        result = asyncio.run(caller())
+        self.assertTrue(result.exists)
+        self.assertTrue(result.email_verified)
+        self.assertEqual(result.errors, [])
+        
+        # The async variant gives the same outcome
+        result_async = asyncio.run(validator.validate_async(
+            username="test_user",
+            email_address="user@example.com",
+            perform_email_verification=True
+        ))
+        self.assertEqual(result_async.to_dict(), result.to_dict())
+        validator.close()
+    
+    @patch('src.core.validator.RedditPersonaValidator._extract_account_info')
+    @patch('src.core.validator.PersonaScorer')
+    @patch('src.core.validator.EmailVerifier')
+    def test_clients_reused_across_validations(self, mock_email_verifier, mock_scorer, mock_extract):
+        """Test email verifiers and scorers are built once and reused across calls."""
+        mock_extract.return_value = self.valid_account_info
+        mock_verifier = mock_email_verifier.return_value
+        mock_verifier.__enter__.return_value = mock_verifier
+        mock_verifier.verify_reddit_account.return_value = self.email_verification_success
+        mock_verifier.verify_reddit_account_async = AsyncMock(return_value=self.email_verification_success)
+        mock_scorer.return_value.calculate_trust_score_with_options.return_value = self.ai_analysis_result
+        
+        validator = RedditPersonaValidator(config_path=self.config_path)
+        for _ in range(3):
+            result = validator.validate(
+                username="test_user",
+                email_address="user@example.com",
+                perform_email_verification=True
+            )
+            self.assertTrue(result.email_verified)
+        result = asyncio.run(validator.validate_async(
+            username="test_user",
+            email_address="user@example.com",
+            perform_email_verification=True
+        ))
+        self.assertTrue(result.email_verified)
+        
+        mock_email_verifier.assert_called_once()
+        mock_scorer.assert_called_once()
+        self.assertEqual(mock_verifier.verify_reddit_account.call_count, 3)
+        mock_verifier.verify_reddit_account_async.assert_awaited_once()
+        validator.close()
+    
     @patch('src.core.validator.RedditPersonaValidator._extract_account_info')
     @patch('src.core.validator.RedditPersonaValidator._cleanup')
     def test_validate_nonexistent_account(self, mock_cleanup, mock_extract):
@@ -343,6 +667,81 @@ class TestRedditPersonaValidator(unittest.TestCase):
         # Verify cleanup was still called
         mock_cleanup.assert_called_once()
     
+    @patch('src.core.validator.RedditPersonaValidator._extract_account_info')
+    @patch('src.core.validator.RedditPersonaValidator._verify_email')
+    @patch('src.core.validator.RedditPersonaValidator._analyze_persona')
+    @patch('src.core.validator.RedditPersonaValidator._cleanup')
+    def test_validate_early_reject(self, mock_cleanup, mock_analyze, mock_verify, mock_extract):
+        """Test that accounts below the early-reject gate skip email and AI checks."""
+        self.test_config["scoring"]["early_reject"] = {
+            "enabled": True,
+            "min_karma": 10,
+            "min_account_age_days": 7
+        }
+        with open(self.config_path, 'w') as f:
+            yaml.dump(self.test_config, f)
+
+        mock_extract.return_value = dict(self.valid_account_info, karma=2, age_days=1)
+
+        validator = RedditPersonaValidator(config_path=self.config_path)
+        result = validator.validate(
+            username="test_user",
+            email_address="user@example.com",
+            perform_email_verification=True,
+            perform_ai_analysis=True
+        )
+
+        self.assertTrue(result.exists)
+        self.assertEqual(result.trust_score, 0.0)
+        mock_verify.assert_not_called()
+        mock_analyze.assert_not_called()
+        mock_cleanup.assert_called_once()
+
+    @patch('src.core.validator.RedditPersonaValidator._extract_account_info')
+    @patch('src.core.validator.RedditPersonaValidator._cleanup')
+    def test_validate_invalid_username(self, mock_cleanup, mock_extract):
+        """Test malformed usernames are rejected without a Reddit lookup."""
+        validator = RedditPersonaValidator(config_path=self.config_path)
+        
+        for username in ["", "ab", "has space", "x" * 21, "ünïcode"]:
+            result = validator.validate(username=username)
+            self.assertFalse(result.exists)
+            self.assertIn("Invalid Reddit username format", result.errors[0])
+        
+        mock_extract.assert_not_called()
+    
+    @patch('src.core.validator.RedditPersonaValidator.validate')
+    def test_validate_many(self, mock_validate):
+        """Test batch validation returns results in request order."""
+        mock_validate.side_effect = lambda username, **kwargs: ValidationResult(
+            username=username, exists=True
+        )
+
+        validator = RedditPersonaValidator(config_path=self.config_path)
+        results = validator.validate_many([
+            {"username": "alice"},
+            {"username": "bob", "email_address": "bob@example.com"},
+            {"username": "carol", "perform_ai_analysis": False}
+        ], max_workers=2)
+
+        self.assertEqual([r.username for r in results], ["alice", "bob", "carol"])
+        self.assertEqual(mock_validate.call_count, 3)
+
+    @patch('src.core.validator.RedditPersonaValidator.validate')
+    def test_validate_many_stream(self, mock_validate):
+        """Test streaming batch validation yields every result."""
+        mock_validate.side_effect = lambda username, **kwargs: ValidationResult(
+            username=username, exists=True
+        )
+
+        validator = RedditPersonaValidator(config_path=self.config_path)
+        stream = validator.validate_many_stream([
+            {"username": "alice"},
+            {"username": "bob"}
+        ], max_workers=2)
+
+        self.assertEqual(sorted(r.username for r in stream), ["alice", "bob"])
+
     @patch('src.core.validator.RedditPersonaValidator._extract_account_info')
     @patch('src.core.validator.RedditPersonaValidator._cleanup')
     def test_validate_with_exception(self, mock_cleanup, mock_extract):
@@ -358,25 +757,70 @@ class TestRedditPersonaValidator(unittest.TestCase):
         # Verify cleanup was still called
         mock_cleanup.assert_called_once()
     
+    @patch('src.core.validator.BrowserEngine')
+    def test_browser_dropped_after_failure(self, mock_browser):
+        """Test a browser whose lookup failed is closed instead of reused."""
+        failed, fresh = MagicMock(), MagicMock()
+        failed.extract_account_info_batch.side_effect = Exception("chrome crashed")
+        fresh.extract_account_info_batch.side_effect = lambda names: {name: dict(self.valid_account_info) for name in names}
+        mock_browser.side_effect = [failed, fresh]
+        
+        validator = RedditPersonaValidator(config_path=self.config_path)
+        validator._extract_account_info("test_user")
+        failed.close.assert_called_once()
+        self.assertEqual(validator._browser_engines, [])
+        
+        result = validator._extract_account_info("test_user")
+        self.assertTrue(result["exists"])
+        self.assertEqual(mock_browser.call_count, 2)
+        self.assertEqual(validator._idle_browsers, [fresh])
+        validator.close()
+    
+    @patch('src.core.validator.BrowserEngine')
+    def test_browser_pool_capped(self, mock_browser):
+        """Test no more than max_workers browsers are started."""
+        self.test_config["concurrency"] = {"max_workers": 1}
+        with open(self.config_path, 'w') as f:
+            yaml.dump(self.test_config, f)
+        
+        validator = RedditPersonaValidator(config_path=self.config_path)
+        engine = validator._init_browser_engine()
+        
+        checked_out = []
+        waiter = threading.Thread(target=lambda: checked_out.append(validator._init_browser_engine()))
+        waiter.start()
+        waiter.join(timeout=0.2)
+        self.assertTrue(waiter.is_alive())
+        
+        # Releasing the engine hands it to the waiting lookup
+        validator._release_browser_engine(engine)
+        waiter.join(timeout=2)
+        self.assertFalse(waiter.is_alive())
+        self.assertEqual(checked_out, [engine])
+        mock_browser.assert_called_once()
+        validator.close()
+    
     @patch('src.core.browser_engine.BrowserEngine')
     @patch('src.core.email_verifier.EmailVerifier')
     def test_cleanup_method(self, mock_email_verifier, mock_browser):
-        """Test the cleanup method closes all resources properly."""
+        """Test close() shuts down all resources properly."""
         # Set up mock instances
         mock_browser_instance = mock_browser.return_value
         mock_email_instance = mock_email_verifier.return_value
         mock_email_instance.is_connected = True
         
         validator = RedditPersonaValidator(config_path=self.config_path)
-        validator.browser_engine = mock_browser_instance
+        validator._browser_engines.append(mock_browser_instance)
         validator.email_verifier = mock_email_instance
         
-        # Call cleanup
-        validator._cleanup()
+        # Close the validator
+        validator.close()
         
         # Verify both resources were closed
         mock_browser_instance.close.assert_called_once()
         mock_email_instance.disconnect.assert_called_once()
+        self.assertEqual(validator._browser_engines, [])
+        self.assertEqual(validator._idle_browsers, [])
     
     @patch('src.core.browser_engine.BrowserEngine')
     @patch('src.core.email_verifier.EmailVerifier')
@@ -391,11 +835,11 @@ class TestRedditPersonaValidator(unittest.TestCase):
         mock_email_instance.disconnect.side_effect = Exception("Email disconnect error")
         
         validator = RedditPersonaValidator(config_path=self.config_path)
-        validator.browser_engine = mock_browser_instance
+        validator._browser_engines.append(mock_browser_instance)
         validator.email_verifier = mock_email_instance
         
-        # Call cleanup - should not raise exceptions
-        validator._cleanup()
+        # Close the validator - should not raise exceptions
+        validator.close()
         
         # Verify both close methods were called despite exceptions
         mock_browser_instance.close.assert_called_once()